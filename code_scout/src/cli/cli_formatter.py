@@ -1,11 +1,102 @@
-from typing import override
+import io
+import os
+import sys
+from collections.abc import Iterator
+from functools import lru_cache
+from typing import TextIO, override
 
 import typer
 
 from core.interfaces.review_formatter import ReviewFormatter
-from core.models.review_finding import ReviewFinding, Severity
+from core.models.review_finding import Category, ReviewFinding, Severity
 from core.models.review_result import ReviewResult
 
+# Colors are only emitted when stdout is a terminal and neither NO_COLOR nor CLICOLOR=0 is set;
+# otherwise _style passes text through unchanged and every style constant below is empty.
+_COLOR_ENABLED = sys.stdout.isatty() and not os.environ.get("NO_COLOR") and os.environ.get("CLICOLOR") != "0"
+
+
+def _style_noop(text: str, **_kwargs: object) -> str:
+    """Stand-in for typer.style when colors are disabled."""
+    return text
+
+
+_style = typer.style if _COLOR_ENABLED else _style_noop
+
+
+def _ansi(fg: str, bold: bool | None = None) -> str:
+    """Returns the ANSI escape prefix that typer.style would emit for the given style."""
+    return _style("", fg=fg, bold=bold, reset=False)
+
+
+# Styles used by the formatter never change, so their escape sequences are built once at import
+# instead of going through typer.style for every styled fragment.
+_RESET = "\x1b[0m" if _COLOR_ENABLED else ""
+_SECTION = _ansi(typer.colors.BRIGHT_BLUE, bold=True)
+_LABEL = _ansi(typer.colors.BLUE, bold=True)
+_SUBLABEL = _ansi(typer.colors.BLUE)
+_NUMBER = _ansi(typer.colors.CYAN)
+_CATEGORY = _ansi(typer.colors.GREEN)
+_SUCCESS = _ansi(typer.colors.GREEN, bold=True)
+_HIGHLIGHT = _ansi(typer.colors.BRIGHT_YELLOW, bold=True)
+_EMPHASIS = _ansi(typer.colors.BRIGHT_WHITE)
+_TEXT = _ansi(typer.colors.WHITE)
+_SUGGESTION = _ansi(typer.colors.YELLOW)
+_MUTED = _ansi(typer.colors.BRIGHT_BLACK)
+
+_EXCERPT_TOP = f"{_MUTED}\n  ┌{'─' * 41}{_RESET}"
+_EXCERPT_BOTTOM = f"{_MUTED}  └{'─' * 41}{_RESET}"
+_TRAILER = "\n==========================================\n\n"
+
+# Complete report for a clean review (no findings, no usage metadata), so the common case only
+# interpolates the three header values.
+_CLEAN_REPORT = (
+    f"{_SECTION}--- Code Review Results ---{_RESET}"
+    f"\nTotal Files Reviewed: {_NUMBER}%s{_RESET}"
+    f"\nTotal Lines Reviewed: {_NUMBER}%s{_RESET}"
+    f"\nReview Duration: {_NUMBER}%.2f{_RESET} seconds"
+    f"{_SECTION}\n\n--- Summary ---{_RESET}{_LABEL}\nSeverity:{_RESET}{_LABEL}\nCategory:{_RESET}"
+    f"{_SUCCESS}\nNo findings to report. Great job!{_RESET}"
+    f"{_TRAILER}"
+)
+
+# DEC private mode 2026 (synchronized output): terminals that support it buffer everything between
+# these markers and paint it in one pass; others ignore them.
+_SYNC_BEGIN = "\x1b[?2026h"
+_SYNC_END = "\x1b[?2026l"
+
+_SEVERITY_COLOR: dict[Severity, str] = {
+    Severity.CRITICAL: typer.colors.RED,
+    Severity.MAJOR: typer.colors.YELLOW,
+    Severity.MINOR: typer.colors.GREEN,
+    Severity.SUGGESTION: typer.colors.BLUE,
+}
+
+_SEVERITY_DISPLAY: dict[Severity, str] = {severity: severity.value.capitalize() for severity in Severity}
+_CATEGORY_DISPLAY: dict[Category, str] = {category: category.value.capitalize() for category in Category}
+
+
+# Severity and category names come from small closed enums, so each styled label is built once
+# per member and reused for every finding.
+@lru_cache(maxsize=None)
+def _styled_severity(severity: Severity, bold: bool | None = None) -> str:
+    """Returns the capitalized severity name styled with its severity color."""
+    return _style(_SEVERITY_DISPLAY[severity], fg=_SEVERITY_COLOR[severity], bold=bold)
+
+
+@lru_cache(maxsize=None)
+def _styled_category(category: Category) -> str:
+    """Returns the capitalized category name styled for the summary block."""
+    return f"{_CATEGORY}{_CATEGORY_DISPLAY[category]}{_RESET}"
+
+
+def _drain(buf: io.StringIO) -> str:
+    """Returns the buffered text and empties the buffer for reuse."""
+    text = buf.getvalue()
+    _ = buf.seek(0)
+    _ = buf.truncate()
+    return text
+
 
 class CliFormatter(ReviewFormatter):
     """
@@ -17,247 +108,178 @@ class CliFormatter(ReviewFormatter):
         """
         Formats the review result into a human-readable string for CLI output.
         """
-        output: list[str] = []
-        output.extend(self._format_header(result))
-        output.extend(self._format_summary(result))
-        output.extend(self._format_findings(result))
-        output.extend(self._format_usage_metadata(result))
-        output.append("\n==========================================\n\n")
-        return "".join(output)
-
-    def _format_header(self, result: ReviewResult) -> list[str]:
-        """Formats the header section of the review results."""
-        return [
-            typer.style(
-                "--- Code Review Results ---",
-                fg=typer.colors.BRIGHT_BLUE,
-                bold=True,
-            ),
-            f"\nTotal Files Reviewed: {typer.style(str(result.total_files_reviewed), fg=typer.colors.CYAN)}",
-            f"\nTotal Lines Reviewed: {typer.style(str(result.total_lines_reviewed), fg=typer.colors.CYAN)}",
-            f"\nReview Duration: {typer.style(f'{result.review_duration:.2f}', fg=typer.colors.CYAN)} seconds",
-        ]
-
-    def _format_summary(self, result: ReviewResult) -> list[str]:
-        """Formats the summary section of the review results."""
-        output = [
-            typer.style("\n\n--- Summary ---", fg=typer.colors.BRIGHT_BLUE, bold=True),
-            typer.style("\nSeverity:", fg=typer.colors.BLUE, bold=True),
-        ]
-
-        for severity, count in result.summary.severity.items():
-            color = self._get_severity_color(severity)
-            output.append(
-                (
-                    f"\n  - {typer.style(severity.value.capitalize(), fg=color)}: "
-                    f"{typer.style(str(count), fg=typer.colors.CYAN)}"
-                )
-            )
+        buf = io.StringIO()
+        for _ in self._write_sections(buf, result):
+            pass
+        return buf.getvalue()
 
-        output.append(typer.style("\nCategory:", fg=typer.colors.BLUE, bold=True))
-        for category, count in result.summary.category.items():
-            output.append(
-                (
-                    f"\n  - {typer.style(category.value.capitalize(), fg=typer.colors.GREEN)}: "
-                    f"{typer.style(str(count), fg=typer.colors.CYAN)}"
-                )
+    @override
+    def write(self, result: ReviewResult, stream: TextIO | None = None) -> None:
+        """
+        Writes the review result section by section, so large reports show up incrementally
+        instead of being assembled into one string first. On a terminal each section is wrapped
+        in synchronized-output markers so it is painted at once.
+        """
+        target = stream or sys.stdout
+        begin, end = (_SYNC_BEGIN, _SYNC_END) if target.isatty() else ("", "")
+        buf = io.StringIO()
+        for _ in self._write_sections(buf, result):
+            typer.echo(f"{begin}{_drain(buf)}{end}", file=target, nl=False)
+
+    def _write_sections(self, buf: io.StringIO, result: ReviewResult) -> Iterator[None]:
+        """
+        Writes the formatted report into buf, yielding after each complete section: header with
+        summary, each finding, and the trailer. Callers that stream drain buf at every yield;
+        callers that want the whole report just exhaust the generator.
+        """
+        if (
+            not result.findings
+            and not result.usage_metadata
+            and not result.summary.severity
+            and not result.summary.category
+        ):
+            _ = buf.write(
+                _CLEAN_REPORT % (result.total_files_reviewed, result.total_lines_reviewed, result.review_duration)
             )
-        return output
+            yield
+            return
 
-    def _format_findings(self, result: ReviewResult) -> list[str]:
-        """Formats the findings section of the review results."""
-        output: list[str] = []
+        self._write_header(buf, result)
+        self._write_summary(buf, result)
         if result.findings:
-            output.append(
-                typer.style(
-                    "\n\n--- Findings ---",
-                    fg=typer.colors.BRIGHT_BLUE,
-                    bold=True,
-                ),
-            )
+            _ = buf.write(f"{_SECTION}\n\n--- Findings ---{_RESET}")
+            yield
             for i, finding in enumerate(result.findings):
-                output.extend(self._format_single_finding(i, finding))
+                self._write_single_finding(buf, i, finding)
+                yield
         else:
-            output.append(
-                typer.style("\nNo findings to report. Great job!", fg=typer.colors.GREEN, bold=True),
-            )
-        return output
-
-    def _format_single_finding(self, index: int, finding: ReviewFinding) -> list[str]:
-        """Formats a single review finding."""
-        output = [
-            typer.style(
-                f"\n\nFinding {index + 1}:",
-                fg=typer.colors.BRIGHT_YELLOW,
-                bold=True,
-            ),
-            "\n  File: ",
-            typer.style(
-                finding.file_path,
-                fg=typer.colors.BRIGHT_WHITE,
-            ),
-        ]
-
-        if finding.line_number:
-            output.append(":")
-            output.append(
-                typer.style(
-                    str(finding.line_number),
-                    fg=typer.colors.BRIGHT_WHITE,
-                )
-            )
-        if finding.line_range:
-            output.append(":")
-            output.append(
-                typer.style(
-                    f"{finding.line_range[0]}-{finding.line_range[1]}",
-                    fg=typer.colors.BRIGHT_WHITE,
-                )
-            )
+            _ = buf.write(f"{_SUCCESS}\nNo findings to report. Great job!{_RESET}")
+        self._write_usage_metadata(buf, result)
+        _ = buf.write(_TRAILER)
+        yield
 
-        severity_color = self._get_severity_color(finding.severity)
-        output.append("\n  Severity: ")
-        output.append(
-            typer.style(
-                finding.severity.value.capitalize(),
-                fg=severity_color,
-                bold=True,
-            ),
+    def _write_header(self, buf: TextIO, result: ReviewResult) -> None:
+        """Writes the header section of the review results."""
+        _ = buf.write(
+            f"{_SECTION}--- Code Review Results ---{_RESET}"
+            f"\nTotal Files Reviewed: {_NUMBER}{result.total_files_reviewed}{_RESET}"
+            f"\nTotal Lines Reviewed: {_NUMBER}{result.total_lines_reviewed}{_RESET}"
+            f"\nReview Duration: {_NUMBER}{result.review_duration:.2f}{_RESET} seconds"
         )
-        output.append(f"\n  Category: {finding.category.value.capitalize()}")
-        output.append(
-            f"\n  Message: {typer.style(finding.message, fg=typer.colors.WHITE)}",
+
+    def _write_summary(self, buf: TextIO, result: ReviewResult) -> None:
+        """Writes the summary section of the review results."""
+        severity_block = "".join(
+            [
+                f"\n  - {_styled_severity(severity)}: {_NUMBER}{count}{_RESET}"
+                for severity, count in result.summary.severity.items()
+            ]
+        )
+        category_block = "".join(
+            [
+                f"\n  - {_styled_category(category)}: {_NUMBER}{count}{_RESET}"
+                for category, count in result.summary.category.items()
+            ]
+        )
+        _ = buf.write(
+            f"{_SECTION}\n\n--- Summary ---{_RESET}"
+            f"{_LABEL}\nSeverity:{_RESET}{severity_block}"
+            f"{_LABEL}\nCategory:{_RESET}{category_block}"
+        )
+
+    def _write_single_finding(self, buf: TextIO, index: int, finding: ReviewFinding) -> None:
+        """Writes a single review finding."""
+        # Optional parts collapse to "" so everything up to the code context goes out as one string.
+        line_number = f":{_EMPHASIS}{finding.line_number}{_RESET}" if finding.line_number else ""
+        line_range = (
+            f":{_EMPHASIS}{finding.line_range[0]}-{finding.line_range[1]}{_RESET}" if finding.line_range else ""
+        )
+        suggestion = f"\n  Suggestion: {_SUGGESTION}{finding.suggestion}{_RESET}" if finding.suggestion else ""
+        code_example = (
+            f"{_SUBLABEL}\n  Code Example:{_RESET}{_MUTED}```\n{finding.code_example}\n```{_RESET}"
+            if finding.code_example
+            else ""
+        )
+
+        _ = buf.write(
+            f"{_HIGHLIGHT}\n\nFinding {index + 1}:{_RESET}"
+            f"\n  File: {_EMPHASIS}{finding.file_path}{_RESET}{line_number}{line_range}"
+            f"\n  Severity: {_styled_severity(finding.severity, bold=True)}"
+            f"\n  Category: {_CATEGORY_DISPLAY[finding.category]}"
+            f"\n  Message: {_TEXT}{finding.message}{_RESET}"
+            f"{suggestion}{code_example}"
         )
-        if finding.suggestion:
-            suggestion_text = typer.style(finding.suggestion, fg=typer.colors.YELLOW)
-            output.append(f"\n  Suggestion: {suggestion_text}")
-        if finding.code_example:
-            output.append(
-                typer.style(
-                    "\n  Code Example:",
-                    fg=typer.colors.BLUE,
-                )
-            )
-            output.append(
-                typer.style(
-                    f"```\n{finding.code_example}\n```",
-                    fg=typer.colors.BRIGHT_BLACK,
-                ),
-            )
 
         # Display code excerpt with context if available
         if finding.code_excerpt:
-            output.append(
-                typer.style(
-                    "\n  Code Context:",
-                    fg=typer.colors.BLUE,
-                    bold=True,
-                )
-            )
-            output.append(self._format_code_excerpt(finding))
+            _ = buf.write(f"{_LABEL}\n  Code Context:{_RESET}")
+            self._write_code_excerpt(buf, finding)
         if finding.tool_name:
-            output.append(
-                typer.style(f"\nTool: {finding.tool_name}", fg=typer.colors.BRIGHT_BLACK),
-            )
-        return output
+            _ = buf.write(f"{_MUTED}\nTool: {finding.tool_name}{_RESET}")
 
-    def _format_usage_metadata(self, result: ReviewResult) -> list[str]:
-        """Formats the usage metadata section of the review results."""
-        output: list[str] = []
+    def _write_usage_metadata(self, buf: TextIO, result: ReviewResult) -> None:
+        """Writes the usage metadata section of the review results."""
         usage_metadata = result.usage_metadata
-        if usage_metadata:
-            output.append(typer.style("\n\n--- Usage Metadata ---", fg=typer.colors.BRIGHT_BLUE, bold=True))
-            output.append(
-                f"\nInput Tokens: {typer.style(str(usage_metadata.get('input_tokens')), fg=typer.colors.CYAN)}"
-            )
-            output.append(
-                f"\nOutput Tokens: {typer.style(str(usage_metadata.get('output_tokens')), fg=typer.colors.CYAN)}"
-            )
-            output.append(
-                f"\nTotal Tokens: {typer.style(str(usage_metadata.get('total_tokens')), fg=typer.colors.CYAN)}"
-            )
+        if not usage_metadata:
+            return
 
-            input_token_details = usage_metadata.get("input_token_details")
-            if input_token_details:
-                output.append(typer.style("\nInput Token Details:", fg=typer.colors.BLUE, bold=True))
-                output.append(f"{input_token_details}")
-
-            output_token_details = usage_metadata.get("output_token_details")
-            if output_token_details:
-                output.append(typer.style("\nOutput Token Details:", fg=typer.colors.BLUE, bold=True))
-                for key, value in output_token_details.items():
-                    output.append(
-                        f"\n  {key.replace('_', ' ').title()}: {typer.style(str(value), fg=typer.colors.CYAN)}"
-                    )
-        return output
-
-    def _format_code_excerpt(self, finding: ReviewFinding) -> str:
+        _ = buf.write(
+            f"{_SECTION}\n\n--- Usage Metadata ---{_RESET}"
+            f"\nInput Tokens: {_NUMBER}{usage_metadata.get('input_tokens')}{_RESET}"
+            f"\nOutput Tokens: {_NUMBER}{usage_metadata.get('output_tokens')}{_RESET}"
+            f"\nTotal Tokens: {_NUMBER}{usage_metadata.get('total_tokens')}{_RESET}"
+        )
+
+        input_token_details = usage_metadata.get("input_token_details")
+        if input_token_details:
+            _ = buf.write(f"{_LABEL}\nInput Token Details:{_RESET}{input_token_details}")
+
+        output_token_details = usage_metadata.get("output_token_details")
+        if output_token_details:
+            _ = buf.write(f"{_LABEL}\nOutput Token Details:{_RESET}")
+            for key, value in output_token_details.items():
+                _ = buf.write(f"\n  {key.replace('_', ' ').title()}: {_NUMBER}{value}{_RESET}")
+
+    def _write_code_excerpt(self, buf: TextIO, finding: ReviewFinding) -> None:
         """
-        Format code excerpt with line numbers and highlighting.
+        Writes the code excerpt with line numbers and highlighting.
         """
         if not finding.code_excerpt or not finding.excerpt_start_line:
-            return ""
+            return
 
-        lines = finding.code_excerpt.split("\n")
-        formatted_lines: list[str] = [
-            typer.style(
-                "\n  ┌─────────────────────────────────────────",
-                fg=typer.colors.BRIGHT_BLACK,
-            )
-        ]
+        # Bind everything the per-line loop touches to locals
+        write = buf.write
+        reset, highlight, text = _RESET, _HIGHLIGHT, _TEXT
 
         # Add top border
+        _ = write(_EXCERPT_TOP)
 
+        # Consecutive lines sharing a style form one run, so each run opens and resets its style
+        # once instead of once per line.
+        run_is_target: bool | None = None
+        target_line = finding.line_number
+        # An empty (0, -1) range never matches, which keeps the loop free of None checks.
+        lo, hi = finding.line_range or (0, -1)
         current_line = finding.excerpt_start_line
-        for line in lines:
+        for line in finding.code_excerpt.split("\n"):
             # Determine if this is the target line
-            is_target_line = (finding.line_number and current_line == finding.line_number) or (
-                finding.line_range and finding.line_range[0] <= current_line <= finding.line_range[1]
-            )
-
-            # Format line number with padding
-            line_num_str = f"{current_line:>3}"
-
-            if is_target_line:
-                # Highlight the target line
-                formatted_line = typer.style(
-                    f"  │ >{line_num_str} | {line}",
-                    fg=typer.colors.BRIGHT_YELLOW,
-                    bold=True,
-                )
+            is_target_line = current_line == target_line or lo <= current_line <= hi
+            if is_target_line != run_is_target:
+                if run_is_target is not None:
+                    _ = write(reset)
+                _ = write("\n" + (highlight if is_target_line else text))
+                run_is_target = is_target_line
             else:
-                # Regular context line
-                formatted_line = typer.style(
-                    f"  │  {line_num_str} | {line}",
-                    fg=typer.colors.WHITE,
-                )
+                _ = write("\n")
 
-            formatted_lines.append(formatted_line)
-            current_line += 1
-
-        # Add bottom border
-        formatted_lines.append(
-            typer.style(
-                "  └─────────────────────────────────────────",
-                fg=typer.colors.BRIGHT_BLACK,
-            )
-        )
+            # Target lines are marked with ">" in front of the padded line number
+            marker = "  │ >" if is_target_line else "  │  "
+            _ = write(marker + str(current_line).rjust(3) + " | " + line)
 
-        return "\n".join(formatted_lines)
+            current_line += 1
 
-    @staticmethod
-    def _get_severity_color(severity: Severity) -> str:
-        """
-        Helper to get color based on severity.
-        """
-        if severity == Severity.CRITICAL:
-            return typer.colors.RED
-        elif severity == Severity.MAJOR:
-            return typer.colors.YELLOW
-        elif severity == Severity.MINOR:
-            return typer.colors.GREEN
-        elif severity == Severity.SUGGESTION:
-            return typer.colors.BLUE
+        # Close the last run and add bottom border
+        _ = write(reset + "\n" + _EXCERPT_BOTTOM)
 
     @override
     def get_formatter_name(self) -> str:
@@ -1,10 +1,55 @@
+from __future__ import annotations
+
+from functools import lru_cache
 from typing import Any
 
+import click
 import typer
 
-from cli.cli_utils import cli_option, echo_debug
-
-
+from cli.cli_utils import clear_env_cache, cli_option, echo_debug
+from cli.entry_point import VERSION_FLAGS, get_version
+
+# Key under which the .env files already loaded during this invocation are kept in the root context.
+_LOADED_ENV_FILES_KEY = "codescout.loaded_env_files"
+# Marker for the default .env file in the set of loaded env files
+_DEFAULT_ENV_FILE = ""
+
+# Model used for reviews when neither --model nor CODESCOUT_MODEL is given
+DEFAULT_MODEL = "openrouter/anthropic/claude-sonnet-4"
+
+# Help texts of the options with longer descriptions
+_HELP_GITHUB_TOKEN = "GitHub API access token. Can be set via CODESCOUT_GITHUB_API_KEY environment variable."
+_HELP_MODEL = "Model to use for code review (e.g., 'openrouter/anthropic/claude-3.7-sonnet')"
+_HELP_OPENROUTER_API_KEY = (
+    "API key for OpenRouter (can be set via CODESCOUT_OPENROUTER_API_KEY env variable or .env file)"
+)
+_HELP_OPENAI_API_KEY = "API key for OpenAI (can be set via CODESCOUT_OPENAI_API_KEY env variable or .env file)"
+_HELP_CLAUDE_API_KEY = "API key for Claude (can be set via CODESCOUT_CLAUDE_API_KEY env variable or .env file)"
+_HELP_CONCURRENCY = (
+    "Number of parallel LLM requests the changed files are split across (1-8, default 1: all files in one "
+    "request). Can be set via CODESCOUT_REVIEW_CONCURRENCY environment variable."
+)
+_HELP_TOOL_CONCURRENCY = (
+    "Maximum number of tool calls (file reads, code index searches) run in parallel for one LLM response "
+    "(default 4, 1 runs them one after another). Can be set via CODESCOUT_TOOL_CONCURRENCY environment variable."
+)
+_HELP_CACHE_TTL = (
+    "How long cached LLM responses and review findings are reused, in seconds (default 604800, 7 days). "
+    "Can be set via CODESCOUT_CACHE_TTL environment variable."
+)
+_HELP_NO_CACHE = (
+    "Always query the LLM instead of reusing cached responses and the findings of unchanged hunks "
+    "from ./.codescout. "
+    "Can be set via CODESCOUT_NO_CACHE environment variable."
+)
+_HELP_FILE_EXTENSIONS = (
+    "Comma-separated list of file extensions to include (e.g., py,js,ts). If empty, all supported files are indexed."
+)
+
+
+# Option definitions are static, so each *_option() factory builds its typer.Option once and hands
+# the same instance to every command that declares it.
+@lru_cache(maxsize=None)
 def repo_owner_option() -> Any:
     return cli_option(
         param_decls=["--repo-owner"],
@@ -15,6 +60,7 @@ def repo_owner_option() -> Any:
     )
 
 
+@lru_cache(maxsize=None)
 def repo_name_option() -> str:
     return cli_option(
         param_decls=["--repo-name"],
@@ -25,16 +71,19 @@ def repo_name_option() -> str:
     )
 
 
+@lru_cache(maxsize=None)
 def pr_number_option() -> int:
     return cli_option(
         param_decls=["--pr-number"],
         env_var_name="CODESCOUT_PR_NUMBER",
         prompt_message="Enter Pull Request number",
         required=True,
+        is_int=True,
         help="Pull request number to review.",
     )
 
 
+@lru_cache(maxsize=None)
 def github_token_option() -> str:
     return cli_option(
         param_decls=["--github-token"],
@@ -42,20 +91,35 @@ def github_token_option() -> str:
         prompt_message="Enter GitHub API key",
         required=True,
         secure_input=True,
-        help="""
-        GitHub API access token. Can be set via CODESCOUT_GITHUB_API_KEY environment variable.
-        """,
+        help=_HELP_GITHUB_TOKEN,
     )
 
 
+@lru_cache(maxsize=None)
 def env_file_option() -> str:
     def _env_file_callback(env_file_path: str | None) -> str | None:
-        """Callback to reload dotenv when custom env file is specified."""
-        if env_file_path:
+        """
+        Callback that loads the default .env file, then the custom env file when one is specified.
+        Runs before any other option is resolved, and not at all for --help.
+        """
+        loaded_env_files: set[str] = (
+            click.get_current_context().find_root().meta.setdefault(_LOADED_ENV_FILES_KEY, set())
+        )
+        if _DEFAULT_ENV_FILE in loaded_env_files and (not env_file_path or env_file_path in loaded_env_files):
+            return env_file_path
+
+        from dotenv import load_dotenv  # noqa: PLC0415
+
+        if _DEFAULT_ENV_FILE not in loaded_env_files:
+            # Searches upwards for a .env file; variables that are already set take precedence
+            _ = load_dotenv()
+            loaded_env_files.add(_DEFAULT_ENV_FILE)
+        if env_file_path and env_file_path not in loaded_env_files:
             echo_debug(f"Loading environment variables from {env_file_path}")
-            from dotenv import load_dotenv
-
             _ = load_dotenv(dotenv_path=env_file_path, override=True)
+            loaded_env_files.add(env_file_path)
+        # Values read before the files were loaded may have been overridden by them
+        clear_env_cache()
         return env_file_path
 
     return typer.Option(
@@ -67,50 +131,60 @@ def env_file_option() -> str:
     )
 
 
+@lru_cache(maxsize=None)
+def version_option() -> bool:
+    def _version_callback(value: bool) -> None:
+        """Prints the version and exits before any other option is resolved."""
+        if value:
+            typer.echo(get_version())
+            raise typer.Exit
+
+    return typer.Option(
+        False,
+        *VERSION_FLAGS,
+        callback=_version_callback,
+        is_eager=True,
+        help="Show the version and exit.",
+    )
+
+
+@lru_cache(maxsize=None)
 def model_option() -> str:
     return typer.Option(
-        default="openrouter/anthropic/claude-sonnet-4",
+        default=DEFAULT_MODEL,
         envvar="CODESCOUT_MODEL",
-        help="""
-            Model to use for code review (e.g.,
-            'openrouter/anthropic/claude-3.7-sonnet')
-        """,
+        help=_HELP_MODEL,
     )
 
 
+@lru_cache(maxsize=None)
 def openrouter_api_key_option() -> str:
     return cli_option(
         param_decls=["--openrouter-api-key"],
         env_var_name="CODESCOUT_OPENROUTER_API_KEY",
-        help="""
-            API key for OpenRouter (can be set via CODESCOUT_OPENROUTER_API_KEY
-            env variable or .env file)
-        """,
+        help=_HELP_OPENROUTER_API_KEY,
     )
 
 
+@lru_cache(maxsize=None)
 def openai_api_key_option() -> str:
     return cli_option(
         param_decls=["--openai-api-key"],
         env_var_name="CODESCOUT_OPENAI_API_KEY",
-        help="""
-            API key for OpenAI (can be set via CODESCOUT_OPENAI_API_KEY env
-            variable or .env file)
-        """,
+        help=_HELP_OPENAI_API_KEY,
     )
 
 
+@lru_cache(maxsize=None)
 def claude_api_key_option() -> str:
     return cli_option(
         param_decls=["--claude-api-key"],
         env_var_name="CODESCOUT_CLAUDE_API_KEY",
-        help="""
-            API key for Claude (can be set via CODESCOUT_CLAUDE_API_KEY env
-            variable or .env file)
-        """,
+        help=_HELP_CLAUDE_API_KEY,
     )
 
 
+@lru_cache(maxsize=None)
 def repo_path_option(required: bool = False) -> str:
     return cli_option(
         param_decls=["--repo-path"],
@@ -121,6 +195,7 @@ def repo_path_option(required: bool = False) -> str:
     )
 
 
+@lru_cache(maxsize=None)
 def code_paths_option() -> list[str]:
     return cli_option(
         param_decls=["--code-path", "-p"],
@@ -131,6 +206,7 @@ def code_paths_option() -> list[str]:
     )
 
 
+@lru_cache(maxsize=None)
 def print_file_paths_option() -> bool:
     return cli_option(
         param_decls=["--print-file-paths"],
@@ -140,16 +216,17 @@ def print_file_paths_option() -> bool:
     )
 
 
+@lru_cache(maxsize=None)
 def file_extensions_option() -> Any:
     return cli_option(
         param_decls=["--file-extensions", "-e"],
         env_var_name="CODESCOUT_INDEX_FILE_EXTENSIONS",
-        help="""Comma-separated list of file extensions to include (e.g., py,js,ts).
-        If empty, all supported files are indexed.""",
+        help=_HELP_FILE_EXTENSIONS,
         is_list=True,
     )
 
 
+@lru_cache(maxsize=None)
 def source_option() -> Any:
     return cli_option(
         param_decls=["--source"],
@@ -158,6 +235,7 @@ def source_option() -> Any:
     )
 
 
+@lru_cache(maxsize=None)
 def target_option() -> Any:
     return cli_option(
         param_decls=["--target"],
@@ -166,6 +244,7 @@ def target_option() -> Any:
     )
 
 
+@lru_cache(maxsize=None)
 def staged_option() -> bool:
     return cli_option(
         param_decls=["--staged"],
@@ -175,6 +254,7 @@ def staged_option() -> bool:
     )
 
 
+@lru_cache(maxsize=None)
 def db_path_option() -> Any:
     return cli_option(
         param_decls=["--db-path"],
@@ -183,6 +263,7 @@ def db_path_option() -> Any:
     )
 
 
+@lru_cache(maxsize=None)
 def allowed_severities_option() -> list[str]:
     return cli_option(
         param_decls=["--allow-severity"],
@@ -191,6 +272,7 @@ def allowed_severities_option() -> list[str]:
     )
 
 
+@lru_cache(maxsize=None)
 def banned_severities_option() -> list[str]:
     return cli_option(
         param_decls=["--ban-severity"],
@@ -199,6 +281,7 @@ def banned_severities_option() -> list[str]:
     )
 
 
+@lru_cache(maxsize=None)
 def allowed_categories_option() -> list[str]:
     return cli_option(
         param_decls=["--allow-category"],
@@ -207,9 +290,50 @@ def allowed_categories_option() -> list[str]:
     )
 
 
+@lru_cache(maxsize=None)
 def banned_categories_option() -> list[str]:
     return cli_option(
         param_decls=["--ban-category"],
         help="A list of categories to exclude (e.g., security, performance).",
         is_list=True,
     )
+
+
+@lru_cache(maxsize=None)
+def concurrency_option() -> int | None:
+    return cli_option(
+        param_decls=["--concurrency"],
+        env_var_name="CODESCOUT_REVIEW_CONCURRENCY",
+        help=_HELP_CONCURRENCY,
+        is_int=True,
+    )
+
+
+@lru_cache(maxsize=None)
+def tool_concurrency_option() -> int | None:
+    return cli_option(
+        param_decls=["--tool-concurrency"],
+        env_var_name="CODESCOUT_TOOL_CONCURRENCY",
+        help=_HELP_TOOL_CONCURRENCY,
+        is_int=True,
+    )
+
+
+@lru_cache(maxsize=None)
+def no_cache_option() -> bool:
+    return cli_option(
+        param_decls=["--no-cache"],
+        env_var_name="CODESCOUT_NO_CACHE",
+        help=_HELP_NO_CACHE,
+        is_bool=True,
+    )
+
+
+@lru_cache(maxsize=None)
+def cache_ttl_option() -> int | None:
+    return cli_option(
+        param_decls=["--cache-ttl"],
+        env_var_name="CODESCOUT_CACHE_TTL",
+        help=_HELP_CACHE_TTL,
+        is_int=True,
+    )
@@ -1,18 +1,51 @@
+from __future__ import annotations
+
 import os
+import sys
 from collections.abc import Generator
 from contextlib import contextmanager
-from typing import Any, Callable, Never, TypeVar
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Never, TypeVar, override
 
+import click
 import typer
-from questionary import Choice, Style, select
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from typer.core import TyperGroup
 
 from cli.cli_config import cli_config
 
+if TYPE_CHECKING:
+    from questionary import Style
+    from rich.console import Console
+
 T = TypeVar("T")
 
-err_console = Console(stderr=True, soft_wrap=True)
+# Key under which the snapshot of CODESCOUT_* variables is kept in the root click context's meta.
+# Snapshotting per invocation (rather than per process) keeps repeated in-process runs, e.g. CliRunner,
+# independent.
+_ENV_CACHE_KEY = "codescout.env_cache"
+# Key under which the root group keeps the invoked subcommand and its arguments in the context's meta
+_SUBCOMMAND_KEY = "codescout.subcommand"
+_ENV_PREFIX = "CODESCOUT_"
+# When set to a true value, missing required options fail instead of prompting, so scripts and CI never block
+_NONINTERACTIVE_ENV_VAR = "CODESCOUT_NONINTERACTIVE"
+# Set to true by CI services (GitHub Actions, GitLab CI, ...); used when CODESCOUT_NONINTERACTIVE is not set
+_CI_ENV_VAR = "CI"
+_TRUE_VALUES = ("1", "true", "yes", "on")
+
+# Escape sequences of the fixed echo_* colors, built once instead of on every message
+_DEBUG_STYLE = typer.style("", fg=typer.colors.BRIGHT_BLACK, reset=False)
+_INFO_STYLE = typer.style("", fg=typer.colors.WHITE, reset=False)
+_WARNING_STYLE = typer.style("", fg=typer.colors.YELLOW, reset=False)
+_RESET = "\x1b[0m"
+
+# Shared immutable default for list options, so option definitions neither allocate nor share a mutable list
+_NO_ITEMS: tuple[str, ...] = ()
+
+# Built on the first select_option call, once questionary has been imported
+_select_style: Style | None = None
+
+# Created on the first error, so regular runs skip rich's terminal detection
+_err_console: Console | None = None
 
 
 def echo_debug(message: str) -> None:
@@ -20,28 +53,116 @@ def echo_debug(message: str) -> None:
     Echoes a debug message with a grayish color using typer.echo, only if debug mode is enabled.
     """
     if cli_config.is_debug:
-        typer.echo(typer.style(f"[DEBUG] {message}", fg=typer.colors.BRIGHT_BLACK))
+        typer.echo(f"{_DEBUG_STYLE}[DEBUG] {message}{_RESET}")
 
 
 def echo_info(message: str) -> None:
     """
     Echoes an informational message with grayish color using typer.echo.
     """
-    typer.echo(typer.style(message, fg=typer.colors.WHITE))
+    typer.echo(f"{_INFO_STYLE}{message}{_RESET}")
 
 
 def echo_warning(message: str) -> None:
     """
     Echoes a warning message with a yellow color using typer.echo.
     """
-    typer.echo(typer.style(message, fg=typer.colors.YELLOW))
+    typer.echo(f"{_WARNING_STYLE}{message}{_RESET}")
+
+
+def _get_err_console() -> Console:
+    """
+    Returns the stderr console used for error messages, creating it on first use.
+    """
+    global _err_console  # noqa: PLW0603
+    if _err_console is None:
+        from rich.console import Console  # noqa: PLC0415
+
+        _err_console = Console(stderr=True, soft_wrap=True)
+    return _err_console
 
 
 def echo_error(message: str) -> None:
     """
     Echoes an error message with a red color using typer.echo.
     """
-    err_console.print(message)
+    _get_err_console().print(message)
+
+
+def get_env(env_var_name: str) -> str | None:
+    """
+    Returns the value of an environment variable. Within a CLI invocation, CODESCOUT_* variables
+    come from a snapshot of the environment taken on first use; other names and lookups outside a
+    click context go straight to os.getenv.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None or not env_var_name.startswith(_ENV_PREFIX):
+        return os.getenv(env_var_name)
+    meta = ctx.find_root().meta
+    env_snapshot: dict[str, str] | None = meta.get(_ENV_CACHE_KEY)
+    if env_snapshot is None:
+        env_snapshot = {key: value for key, value in os.environ.items() if key.startswith(_ENV_PREFIX)}
+        meta[_ENV_CACHE_KEY] = env_snapshot
+    return env_snapshot.get(env_var_name)
+
+
+def _is_non_interactive() -> bool:
+    """Whether prompting must be skipped: CODESCOUT_NONINTERACTIVE if set, otherwise whether running on CI."""
+    non_interactive = get_env(_NONINTERACTIVE_ENV_VAR)
+    if non_interactive is None:
+        non_interactive = get_env(_CI_ENV_VAR) or ""
+    return non_interactive.lower() in _TRUE_VALUES
+
+
+def clear_env_cache() -> None:
+    """
+    Drops the environment snapshot of the current CLI invocation, e.g. after loading a .env file.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None:
+        _ = ctx.find_root().meta.pop(_ENV_CACHE_KEY, None)
+
+
+class SubcommandArgsGroup(TyperGroup):
+    """
+    Group that keeps the invoked subcommand and its arguments in the context's meta. Click removes them
+    from the context before the group callback runs, but the callback needs them for is_help_requested.
+    """
+
+    @override
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        cmd_name, cmd, cmd_args = super().resolve_command(ctx, args)
+        ctx.meta[_SUBCOMMAND_KEY] = (cmd, list(cmd_args))
+        return cmd_name, cmd, cmd_args
+
+
+def is_help_requested(ctx: click.Context) -> bool:
+    """
+    Returns True when a subcommand is going to show its help instead of running, e.g. for
+    `codescout git review --help`. The arguments kept by SubcommandArgsGroup are parsed the way click
+    will parse them, so option values such as `--source --help` don't count as a help flag.
+    """
+    command, args = ctx.meta.get(_SUBCOMMAND_KEY, (None, []))
+    parent = ctx
+    while command is not None:
+        if not args and command.no_args_is_help:
+            return True
+        command_ctx = click.Context(command, info_name=command.name, parent=parent, resilient_parsing=True)
+        try:
+            opts, args, _ = command.make_parser(command_ctx).parse_args(args)
+            help_option = command.get_help_option(command_ctx)
+            if help_option is not None and opts.get(help_option.name):
+                return True
+            if not isinstance(command, click.Group) or not args:
+                return False
+            _, command, args = command.resolve_command(command_ctx, args)
+        except click.UsageError:
+            # Click reports the invalid command line itself once the subcommand runs
+            return False
+        parent = command_ctx
+    return False
 
 
 def select_option(message: str, choices: list[tuple[str, T]]) -> T | None:
@@ -50,29 +171,35 @@ def select_option(message: str, choices: list[tuple[str, T]]) -> T | None:
     Choices are provided as a list of (display_string, value) tuples.
     Returns the selected value.
     """
-    custom_style = Style(
-        [
-            ("qmark", "fg:#673ab7 bold"),
-            ("question", "bold"),
-            ("selected", "bg:#2ecc71 fg:#000000"),
-            ("pointer", "fg:#3498db bold"),
-            ("highlighted", "bg:#2ecc71 fg:#000000"),
-            ("answer", "fg:#2ecc71 bold"),
-            ("text", "fg:#2ecc71"),
-        ]
-    )
+    if not choices:
+        return None
+
+    global _select_style  # noqa: PLW0603
+    # questionary is only needed for interactive prompts, so it is not imported at startup
+    from questionary import Choice, Style, select  # noqa: PLC0415
+
+    if _select_style is None:
+        _select_style = Style(
+            [
+                ("qmark", "fg:#673ab7 bold"),
+                ("question", "bold"),
+                ("selected", "bg:#2ecc71 fg:#000000"),
+                ("pointer", "fg:#3498db bold"),
+                ("highlighted", "bg:#2ecc71 fg:#000000"),
+                ("answer", "fg:#2ecc71 bold"),
+                ("text", "fg:#2ecc71"),
+            ]
+        )
     # questionary's select expects a list of strings or Choice objects.
     # When given (display, value) tuples, it displays 'display' and returns 'value'.
     # To satisfy type checkers, we convert the tuples to Choice objects.
     questionary_choices = [Choice(title=display, value=value) for display, value in choices]
-    if not questionary_choices:
-        return None
 
     return select(
         message,
         choices=questionary_choices,
         qmark="?",
-        style=custom_style,
+        style=_select_style,
     ).ask()
 
 
@@ -87,7 +214,7 @@ def select_from_paginated_options(
     Args:
         message: The message to display to the user.
         fetch_page_func: A callable that takes (page_number, per_page) and returns
-                         a list of (display_text, value) tuples for that page.
+                         a new list of (display_text, value) tuples for that page.
         per_page: The number of items to display per page.
 
     Returns:
@@ -95,12 +222,10 @@ def select_from_paginated_options(
     """
     page = 0
     all_options_loaded = False
-    all_fetched_options: list[tuple[str, Any]] = []
 
     while True:
         with show_spinner(label=f"Fetching options (page {page + 1})"):
             current_page_options = fetch_page_func(page, per_page)
-            all_fetched_options.extend(current_page_options)
 
         if not current_page_options and page == 0:
             echo_info("No options available.")
@@ -108,8 +233,10 @@ def select_from_paginated_options(
         elif not current_page_options:
             all_options_loaded = True
 
-        # Ensure display_choices can hold both T and "show_more"
-        display_choices: list[tuple[str, Any]] = list(current_page_options)
+        # The page list is freshly returned by fetch_page_func and not kept anywhere else, so the
+        # "Show more..." entry is appended to it directly instead of to a copy.
+        # Typed as Any so it can hold both T and "show_more"
+        display_choices: list[tuple[str, Any]] = current_page_options
 
         if not all_options_loaded:
             display_choices.append(("Show more...", "show_more"))
@@ -131,7 +258,14 @@ def select_from_paginated_options(
 def show_spinner(label: str) -> Generator[None, Any, None]:
     """
     Displays a spinner while a block of code is executing.
+    Does nothing when stdout is not a terminal (piped output, CI), where a spinner is not visible anyway.
     """
+    if not sys.stdout.isatty():
+        yield
+        return
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn  # noqa: PLC0415
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -142,6 +276,28 @@ def show_spinner(label: str) -> Generator[None, Any, None]:
         progress.remove_task(task_id)
 
 
+def _split_csv(value: str) -> list[str]:
+    """
+    Splits a comma-separated value into its non-empty, stripped items.
+    """
+    items: list[str] = []
+    for item in value.split(","):
+        stripped = item.strip()
+        if stripped:
+            items.append(stripped)
+    return items
+
+
+def _parse_int(value: str) -> int:
+    """
+    Converts an option value that did not come from the command line (env variable, prompt) to int.
+    """
+    try:
+        return int(value)
+    except ValueError as e:
+        raise typer.BadParameter(f"{value!r} is not a valid integer.") from e
+
+
 def get_option_or_env_var(  # noqa PLR013
     param_decls: list[str],
     option_value: Any | None,
@@ -151,6 +307,7 @@ def get_option_or_env_var(  # noqa PLR013
     secure_input: bool = False,
     is_list: bool = False,
     is_bool: bool = False,
+    is_int: bool = False,
 ) -> Any | None:
     """
     Retrieves a value from a Typer option or an environment variable.
@@ -161,50 +318,54 @@ def get_option_or_env_var(  # noqa PLR013
         option_value: The value passed via the Typer option.
         env_var_name: The name of the environment variable to check.
         prompt_message: The message to display if prompting the user for input.
-        required: If True, the user will be prompted if the value is missing.
+        required: If True, the user will be prompted if the value is missing, unless
+                  CODESCOUT_NONINTERACTIVE (or, without it, CI) is true, in which case it is an error.
                   If False, None is returned if the value is not found.
         secure_input: If True, the user's input will be hidden (e.g., for API keys).
         is_list: If True, the environment variable value will be split by comma.
+        is_int: If True, values from the environment variable or the prompt are converted to int.
 
     Returns:
         The retrieved value, or None if not found and not required.
 
     Raises:
         typer.Exit: If the value is required but not provided by the user.
+        typer.BadParameter: If is_int is set and the value is not a valid integer.
     """
-    if is_bool and isinstance(option_value, bool):
-        return option_value
-    if is_list and isinstance(option_value, list) and len(option_value) > 0:
+    # Explicitly passed values win, even falsy ones like 0 or --no-flag. An empty string counts as not given,
+    # and list options only accept an actual non-empty list, as their default is an empty tuple.
+    if (
+        option_value is not None
+        and option_value != ""
+        and (not is_list or (isinstance(option_value, list) and option_value))
+    ):
         return option_value  # pyright: ignore[reportUnknownVariableType]
-    if not is_list and option_value:
-        return option_value  # pyright: ignore[reportUnknownVariableType]
-    env_value = os.getenv(env_var_name)
 
+    env_value = get_env(env_var_name)
     if env_value is not None:
         if is_bool:
-            return env_value.lower() in ("1", "true", "yes", "on")
+            return env_value.lower() in _TRUE_VALUES
         if is_list:
-            return [item.strip() for item in env_value.split(",") if item.strip()]
+            return _split_csv(env_value)
+        if is_int:
+            return _parse_int(env_value)
         return env_value
 
-    if required:
-        if prompt_message:
-            value = typer.prompt(prompt_message, hide_input=secure_input)
-            if value:
-                if is_list:
-                    return [item.strip() for item in value.split(",") if item.strip()]
-                return value
-            else:
-                echo_error(
-                    f"Error: {param_decls} or {env_var_name.strip()} env variable is required but was not provided."
-                )
-                raise typer.Exit(code=1)
-        else:
-            echo_error(f"Error: {param_decls} or {env_var_name.strip()} env variable is required but was not provided.")
-            raise typer.Exit(code=1)
-    elif is_list:
-        return []
-    return None
+    if not required:
+        return [] if is_list else None
+
+    value = (
+        typer.prompt(prompt_message, hide_input=secure_input) if prompt_message and not _is_non_interactive() else None
+    )
+    if value:
+        if is_list:
+            return _split_csv(value)
+        if is_int:
+            return _parse_int(value)
+        return value
+
+    echo_error(f"Error: {param_decls} or {env_var_name.strip()} env variable is required but was not provided.")
+    raise typer.Exit(code=1)
 
 
 def cli_option(  # noqa PLR013
@@ -216,6 +377,7 @@ def cli_option(  # noqa PLR013
     help: str | None = None,
     is_list: bool = False,
     is_bool: bool = False,
+    is_int: bool = False,
 ) -> Any:
     """
     A custom Typer Option factory that integrates environment variable lookup
@@ -230,25 +392,33 @@ def cli_option(  # noqa PLR013
         help: The help message for the CLI option.
         default: The default value for the option.
         is_list: If True, the option expects a list of values (e.g., multiple --code-path).
+        is_int: If True, values from the environment variable or the prompt are converted to int.
 
     Returns:
         A typer.Option object configured with the custom callback.
     """
 
-    def callback(value: Any | None) -> Any:
-        return get_option_or_env_var(
-            param_decls=param_decls,
-            option_value=value,
-            env_var_name=env_var_name,
-            prompt_message=prompt_message,
-            required=required,
-            secure_input=secure_input,
-            is_list=is_list,
-            is_bool=is_bool,
-        )
+    # Everything but the parsed value is fixed per option, so it is bound once here
+    resolve = partial(
+        get_option_or_env_var,
+        param_decls=param_decls,
+        env_var_name=env_var_name,
+        prompt_message=prompt_message,
+        required=required,
+        secure_input=secure_input,
+        is_list=is_list,
+        is_bool=is_bool,
+        is_int=is_int,
+    )
+
+    def callback(ctx: typer.Context, value: Any | None) -> Any:
+        # Shell completion parses the command line without running it, so nothing to resolve or prompt for
+        if ctx.resilient_parsing:
+            return value
+        return resolve(option_value=value)
 
     return typer.Option(
-        [] if is_list else None,
+        _NO_ITEMS if is_list else None,
         *param_decls,
         callback=callback,
         help=help,
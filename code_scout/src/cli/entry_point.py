@@ -0,0 +1,31 @@
+"""Console script of Code Scout, which answers trivial invocations before the Typer app is imported."""
+
+import sys
+
+PACKAGE_NAME = "code_scout"
+VERSION_FLAGS = ("--version", "-V")
+
+
+def get_version() -> str:
+    """Returns the version of the installed package."""
+    from importlib.metadata import PackageNotFoundError, version  # noqa: PLC0415
+
+    try:
+        return version(PACKAGE_NAME)
+    except PackageNotFoundError:
+        # Running from a source checkout that isn't installed
+        return "unknown"
+
+
+def main() -> None:
+    """
+    Runs the CLI. A bare `codescout --version` is answered directly, as importing Typer and Rich
+    takes most of the startup time of the CLI.
+    """
+    if len(sys.argv) == 2 and sys.argv[1] in VERSION_FLAGS:  # noqa: PLR2004
+        print(get_version())
+        return
+
+    from cli.main import app  # noqa: PLC0415
+
+    app()
@@ -1,27 +1,25 @@
+import os
+
 import typer
-from dotenv import load_dotenv
-from typer.testing import CliRunner
 
 from cli.cli_config import cli_config
-from cli.cli_formatter import CliFormatter
-from cli.code_scout_context import CodeScoutContext
-from core.diff_providers.git_diff_provider import GitDiffProvider
-from core.llm_providers.langchain_provider import LangChainProvider
-from core.services.code_review_agent import CodeReviewAgent
-from core.tools.file_content_tool import FileContentTool
-from core.tools.search_code_index_tool import SearchCodeIndexTool
-from src.cli.cli_options import (
+from cli.cli_options import (
+    DEFAULT_MODEL,
     allowed_categories_option,
     allowed_severities_option,
     banned_categories_option,
     banned_severities_option,
+    cache_ttl_option,
+    concurrency_option,
+    no_cache_option,
     repo_path_option,
     source_option,
     staged_option,
     target_option,
+    tool_concurrency_option,
 )
-from src.cli.cli_utils import echo_debug, handle_cli_exception
-from src.core.models.review_config import ReviewConfig
+from cli.cli_utils import echo_debug, handle_cli_exception
+from cli.code_scout_context import CodeScoutContext
 
 git_app = typer.Typer(
     no_args_is_help=True,
@@ -40,20 +38,38 @@ def review(
     banned_severities: list[str] = banned_severities_option(),
     allowed_categories: list[str] = allowed_categories_option(),
     banned_categories: list[str] = banned_categories_option(),
+    concurrency: int | None = concurrency_option(),
+    tool_concurrency: int | None = tool_concurrency_option(),
+    no_cache: bool = no_cache_option(),
+    cache_ttl: int | None = cache_ttl_option(),
 ) -> None:
     """
     Reviews code changes in a Git repository.
     """
     code_scout_context: CodeScoutContext = ctx.obj
-    echo_debug(
-        f"""
+    # The f-string is only built when debug output is actually shown
+    if cli_config.is_debug:
+        echo_debug(
+            f"""
         Reviewing Git repository.
         repo_path:\t{repo_path}
         source:\t\t{source}
         target:\t\t{target}
         staged:\t\t{staged}
 """,
-    )
+        )
+    # The review pipeline pulls in GitPython, LangChain and the LLM SDKs, so it is only imported once a
+    # review actually runs; --help and shell completion don't pay for it.
+    from cli.cli_formatter import CliFormatter  # noqa: PLC0415
+    from core.diff_providers.git_diff_provider import GitDiffProvider  # noqa: PLC0415
+    from core.llm_providers.cached_langchain_provider import CachedLangChainProvider  # noqa: PLC0415
+    from core.llm_providers.langchain_provider import LangChainProvider  # noqa: PLC0415
+    from core.models.review_config import DEFAULT_TOOL_CONCURRENCY, ReviewConfig  # noqa: PLC0415
+    from core.review_chains.hunk_findings_cache import HunkFindingsCache  # noqa: PLC0415
+    from core.services.code_review_agent import CodeReviewAgent  # noqa: PLC0415
+    from core.tools.file_content_tool import FileContentTool  # noqa: PLC0415
+    from core.tools.search_code_index_tool import SearchCodeIndexTool  # noqa: PLC0415
+
     try:
         git_diff_provider = GitDiffProvider(
             repo_path=repo_path,
@@ -62,7 +78,7 @@ def review(
             staged=staged,
         )
 
-        llm_provider = LangChainProvider()
+        llm_provider = LangChainProvider() if no_cache else CachedLangChainProvider(ttl_seconds=cache_ttl)
 
         review_config = ReviewConfig(
             langchain_tools=[
@@ -73,6 +89,9 @@ def review(
             banned_severities=banned_severities,
             allowed_categories=allowed_categories,
             banned_categories=banned_categories,
+            concurrency=1 if concurrency is None else concurrency,
+            tool_concurrency=DEFAULT_TOOL_CONCURRENCY if tool_concurrency is None else tool_concurrency,
+            findings_cache=None if no_cache else HunkFindingsCache(ttl_seconds=cache_ttl),
         )
 
         review_agent = CodeReviewAgent(
@@ -89,19 +108,36 @@ def review(
 
 
 if __name__ == "__main__":
-    # The load_dotenv call here is for testing purposes when running github_cli.py directly.
-    # In a real CLI execution via main.py, dotenv is loaded by main.py's callback.
+    from dotenv import load_dotenv
+
+    # The load_dotenv call here is for testing purposes when running git_cli.py directly.
+    # In a real CLI execution via main.py, dotenv is loaded by the --env-file option callback.
     _ = load_dotenv("../../.codescout.env")  # Assign to _ to explicitly ignore the result
     cli_config.is_debug = True
-    runner = CliRunner()
-    from cli.main import app
 
-    # Example usage of review-pr command
-    result = runner.invoke(
-        app,
-        ["git", "review"],
-        catch_exceptions=False,
-        color=True,
+    # Call the command directly instead of dispatching through click, so options are passed
+    # explicitly and the CodeScoutContext that main.py's callback would create is built here.
+    ctx = typer.Context(typer.main.get_command(git_app))
+    ctx.obj = CodeScoutContext(
+        model=os.getenv("CODESCOUT_MODEL", DEFAULT_MODEL),
+        openrouter_api_key=os.getenv("CODESCOUT_OPENROUTER_API_KEY"),
+        openai_api_key=os.getenv("CODESCOUT_OPENAI_API_KEY"),
+        claude_api_key=os.getenv("CODESCOUT_CLAUDE_API_KEY"),
+    )
+
+    # Equivalent of `codescout git review`
+    review(
+        ctx,
+        repo_path=os.getenv("CODESCOUT_REPO_PATH", "."),
+        source=os.getenv("CODESCOUT_SOURCE", "HEAD~1"),
+        target=os.getenv("CODESCOUT_TARGET", "HEAD"),
+        staged=os.getenv("CODESCOUT_STAGED", "").lower() in ("1", "true", "yes", "on"),
+        allowed_severities=[],
+        banned_severities=[],
+        allowed_categories=[],
+        banned_categories=[],
+        concurrency=None,
+        tool_concurrency=None,
+        no_cache=False,
+        cache_ttl=None,
     )
-    print(f"Err: {result.stderr}")
-    print(f"stdout: {result.stdout}")
@@ -1,34 +1,38 @@
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
 import typer
-from dotenv import load_dotenv
-from typer.testing import CliRunner
 
 from cli.cli_config import cli_config
-from cli.code_scout_context import CodeScoutContext
-from core.diff_providers.github_diff_provider import GitHubDiffProvider
-from core.llm_providers.langchain_provider import LangChainProvider
-from core.services.code_review_agent import CodeReviewAgent
-from core.tools.file_content_tool import FileContentTool
-from core.tools.search_code_index_tool import SearchCodeIndexTool
-from src.cli.cli_formatter import CliFormatter
-from src.cli.cli_options import (
+from cli.cli_options import (
+    DEFAULT_MODEL,
     allowed_categories_option,
     allowed_severities_option,
     banned_categories_option,
     banned_severities_option,
+    cache_ttl_option,
+    concurrency_option,
     github_token_option,
+    no_cache_option,
     pr_number_option,
     repo_name_option,
     repo_owner_option,
+    tool_concurrency_option,
 )
-from src.cli.cli_utils import (
+from cli.cli_utils import (
     echo_info,
     echo_warning,
     handle_cli_exception,
     select_from_paginated_options,
     select_option,
 )
-from src.core.models.review_config import ReviewConfig
-from src.core.services.github_service import GitHubService
+from cli.code_scout_context import CodeScoutContext
+
+if TYPE_CHECKING:
+    from github.PullRequest import PullRequest
+
+    from core.diff_providers.github_diff_provider import GitHubDiffProvider
 
 app = typer.Typer(
     no_args_is_help=True,
@@ -46,6 +50,11 @@ def _perform_review(
     banned_severities: list[str],
     allowed_categories: list[str],
     banned_categories: list[str],
+    concurrency: int | None = None,
+    tool_concurrency: int | None = None,
+    no_cache: bool = False,
+    cache_ttl: int | None = None,
+    diff_provider: "GitHubDiffProvider | None" = None,
 ) -> None:
     """
     Private method to perform the actual code review logic.
@@ -53,8 +62,20 @@ def _perform_review(
     code_scout_context: CodeScoutContext = ctx.obj
     echo_info(f"Attempting to review PR #{pr_number} in {repo_owner}/{repo_name}")
 
+    # The review pipeline pulls in PyGithub, LangChain and the LLM SDKs, so it is only imported once a
+    # review actually runs; --help and shell completion don't pay for it.
+    from cli.cli_formatter import CliFormatter  # noqa: PLC0415
+    from core.diff_providers.github_diff_provider import GitHubDiffProvider  # noqa: PLC0415
+    from core.llm_providers.cached_langchain_provider import CachedLangChainProvider  # noqa: PLC0415
+    from core.llm_providers.langchain_provider import LangChainProvider  # noqa: PLC0415
+    from core.models.review_config import DEFAULT_TOOL_CONCURRENCY, ReviewConfig  # noqa: PLC0415
+    from core.review_chains.hunk_findings_cache import HunkFindingsCache  # noqa: PLC0415
+    from core.services.code_review_agent import CodeReviewAgent  # noqa: PLC0415
+    from core.tools.file_content_tool import FileContentTool  # noqa: PLC0415
+    from core.tools.search_code_index_tool import SearchCodeIndexTool  # noqa: PLC0415
+
     try:
-        diff_provider = GitHubDiffProvider(
+        diff_provider = diff_provider or GitHubDiffProvider(
             repo_owner=repo_owner,
             repo_name=repo_name,
             pr_number=pr_number,
@@ -70,11 +91,14 @@ def _perform_review(
             banned_severities=banned_severities,
             allowed_categories=allowed_categories,
             banned_categories=banned_categories,
+            concurrency=1 if concurrency is None else concurrency,
+            tool_concurrency=DEFAULT_TOOL_CONCURRENCY if tool_concurrency is None else tool_concurrency,
+            findings_cache=None if no_cache else HunkFindingsCache(ttl_seconds=cache_ttl),
         )
 
         review_agent = CodeReviewAgent(
             diff_provider=diff_provider,
-            llm_provider=LangChainProvider(),
+            llm_provider=LangChainProvider() if no_cache else CachedLangChainProvider(ttl_seconds=cache_ttl),
             formatters=[CliFormatter()],
             cli_context=code_scout_context,
             config=review_config,
@@ -99,6 +123,10 @@ def review_pr(
     banned_severities: list[str] = banned_severities_option(),
     allowed_categories: list[str] = allowed_categories_option(),
     banned_categories: list[str] = banned_categories_option(),
+    concurrency: int | None = concurrency_option(),
+    tool_concurrency: int | None = tool_concurrency_option(),
+    no_cache: bool = no_cache_option(),
+    cache_ttl: int | None = cache_ttl_option(),
 ) -> None:
     """
     Review a specific pull request from a GitHub repository.
@@ -113,6 +141,10 @@ def review_pr(
         banned_severities,
         allowed_categories,
         banned_categories,
+        concurrency,
+        tool_concurrency,
+        no_cache,
+        cache_ttl,
     )
 
 
@@ -126,28 +158,56 @@ def interactive_review(
     banned_severities: list[str] = banned_severities_option(),
     allowed_categories: list[str] = allowed_categories_option(),
     banned_categories: list[str] = banned_categories_option(),
+    concurrency: int | None = concurrency_option(),
+    tool_concurrency: int | None = tool_concurrency_option(),
+    no_cache: bool = no_cache_option(),
+    cache_ttl: int | None = cache_ttl_option(),
 ) -> None:
     echo_info(message=f"Starting github interactive review for {repo_owner}/{repo_name}")
+    from core.diff_providers.github_diff_provider import GitHubDiffProvider  # noqa: PLC0415
+    from core.services.github_service import GitHubService  # noqa: PLC0415
+
     try:
         github_service = GitHubService(github_token, repo_owner, repo_name)
+        # While the user is choosing from one page, the next one is already being fetched
+        prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="codescout-pr-prefetch")
+        prefetched_pages: dict[int, Future[list[PullRequest]]] = {}
 
         def fetch_pull_requests_page(page: int, _per_page: int) -> list[tuple[str, int]]:
-            pull_requests = github_service.get_open_pull_requests(page=page)
+            future = prefetched_pages.pop(page, None)
+            pull_requests = future.result() if future else github_service.get_open_pull_requests(page=page)
+            if pull_requests:
+                prefetched_pages[page + 1] = prefetch_executor.submit(github_service.get_open_pull_requests, page + 1)
             return [
                 (f"#{pr.number}: {pr.title} by {pr.user.login} (Branch: {pr.head.ref})", pr.number)
                 for pr in pull_requests
             ]
 
-        selected_pr_number = select_from_paginated_options(
-            "Select a Pull Request to review",
-            fetch_pull_requests_page,
-            per_page=10,
-        )
+        try:
+            selected_pr_number = select_from_paginated_options(
+                "Select a Pull Request to review",
+                fetch_pull_requests_page,
+                per_page=10,
+            )
+        finally:
+            # Don't hold up the review for a page nobody is going to look at
+            prefetch_executor.shutdown(wait=False, cancel_futures=True)
 
         if selected_pr_number is None:
             echo_info("No PR selected. Exiting interactive review.")
             raise typer.Exit()
 
+        # The PR diff is fetched while the user decides, so a review can start right away.
+        # The provider reuses this session's GitHubService instead of connecting again.
+        diff_provider = GitHubDiffProvider(
+            repo_owner=repo_owner,
+            repo_name=repo_name,
+            pr_number=selected_pr_number,
+            github_token=github_token,
+            github_service=github_service,
+        )
+        diff_provider.prefetch()
+
         action_choices = [("Do Code Review", "review"), ("Cancel", "cancel")]
         selected_action = select_option(
             "What would you like to do?",
@@ -167,6 +227,11 @@ def interactive_review(
                 banned_severities=banned_severities,
                 allowed_categories=allowed_categories,
                 banned_categories=banned_categories,
+                concurrency=concurrency,
+                tool_concurrency=tool_concurrency,
+                no_cache=no_cache,
+                cache_ttl=cache_ttl,
+                diff_provider=diff_provider,
             )
         else:
             echo_warning(f"Invalid action selected: {selected_action}")
@@ -179,18 +244,36 @@ def interactive_review(
 
 
 if __name__ == "__main__":
+    from dotenv import load_dotenv
+
     # The load_dotenv call here is for testing purposes when running github_cli.py directly.
-    # In a real CLI execution via main.py, dotenv is loaded by main.py's callback.
+    # In a real CLI execution via main.py, dotenv is loaded by the --env-file option callback.
     _ = load_dotenv(".codescout.env")  # Assign to _ to explicitly ignore the result
     cli_config.is_debug = True
-    runner = CliRunner()
+
+    # Call the command directly instead of dispatching through click, so options are passed
+    # explicitly and the CodeScoutContext that main.py's callback would create is built here.
+    ctx = typer.Context(typer.main.get_command(app))
+    ctx.obj = CodeScoutContext(
+        model=os.getenv("CODESCOUT_MODEL", DEFAULT_MODEL),
+        openrouter_api_key=os.getenv("CODESCOUT_OPENROUTER_API_KEY"),
+        openai_api_key=os.getenv("CODESCOUT_OPENAI_API_KEY"),
+        claude_api_key=os.getenv("CODESCOUT_CLAUDE_API_KEY"),
+    )
 
     # Example usage of review-pr command
-    result = runner.invoke(
-        app,
-        ["review-pr", "--pr-number", "257"],
-        catch_exceptions=False,
-        color=True,
+    review_pr(
+        ctx,
+        repo_owner=os.getenv("CODESCOUT_REPO_OWNER", ""),
+        repo_name=os.getenv("CODESCOUT_REPO_NAME", ""),
+        pr_number=257,
+        github_token=os.getenv("CODESCOUT_GITHUB_API_KEY", ""),
+        allowed_severities=[],
+        banned_severities=[],
+        allowed_categories=[],
+        banned_categories=[],
+        concurrency=None,
+        tool_concurrency=None,
+        no_cache=False,
+        cache_ttl=None,
     )
-    print(f"Err: {result.stderr}")
-    print(f"stdout: {result.stdout}")
@@ -1,7 +1,11 @@
 """CLI commands for managing the code index."""
 
+import atexit
 import json
-from pathlib import Path
+import os
+import textwrap
+from collections.abc import Iterable
+from typing import Any
 
 import typer
 
@@ -9,7 +13,13 @@ from cli.cli_options import code_paths_option, db_path_option, file_extensions_o
 from cli.cli_utils import echo_info, echo_warning, handle_cli_exception
 from core.code_index.code_index_config import CodeIndexConfig
 from core.code_index.code_index_manager import CodeIndexManager
-from core.code_index.models import CodeIndexQuery
+from core.code_index.models import CodeIndexQuery, CodeSymbol
+
+try:
+    # orjson comes with LangChain, but has no wheels for every interpreter, e.g. PyPy
+    import orjson
+except ImportError:
+    orjson = None
 
 app = typer.Typer(
     no_args_is_help=True,
@@ -22,6 +32,72 @@ def _get_default_db_path() -> str:
     return "./.codescout/code_index.db"
 
 
+def _ensure_db_dir(db_path: str) -> None:
+    """Ensure the directory of the database (e.g. .codescout) exists."""
+    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+
+
+def _db_exists(db_path: str) -> bool:
+    return os.path.isfile(db_path)
+
+
+def _dumps(value: Any, indent: bool = True) -> str:
+    """Serializes command output to JSON, using orjson when it is available."""
+    if orjson is None:
+        return json.dumps(value, indent=2 if indent else None)
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else None).decode()
+
+
+def _echo_json_array(items: Iterable[Any]) -> None:
+    """Writes items as an indented JSON array, one item at a time."""
+    separator = "["
+    for item in items:
+        typer.echo(separator)
+        typer.echo(textwrap.indent(_dumps(item), "  "), nl=False)
+        separator = ","
+    typer.echo("[]" if separator == "[" else "\n]")
+
+
+def _symbol_to_dict(symbol: CodeSymbol) -> dict[str, Any]:
+    return {
+        "id": symbol.id,
+        "name": symbol.name,
+        "symbol_type": symbol.symbol_type,
+        "language": symbol.language,
+        "file_path": symbol.file_path,
+        "line": symbol.start_line_number,
+        "signature": symbol.signature,
+        "docstring": symbol.docstring,
+        "score": getattr(symbol, "score", 0),
+        "reasons": getattr(symbol, "reasons", []),
+    }
+
+
+# Managers reused across commands run in the same process, most recently used last
+_managers: dict[CodeIndexConfig, CodeIndexManager] = {}
+_MAX_CACHED_MANAGERS = 4
+
+
+def _manager_for(db_path: str, file_extensions: list[str] | None = None) -> CodeIndexManager:
+    """
+    Get the code index manager for a database, reusing it and its SQLite connection when several
+    commands run in the same process.
+    """
+    config = CodeIndexConfig(db_path=db_path, file_extensions=file_extensions)
+    manager = _managers.pop(config, None) or CodeIndexManager(config)
+    _managers[config] = manager
+    if len(_managers) > _MAX_CACHED_MANAGERS:
+        _managers.pop(next(iter(_managers))).close()
+    return manager
+
+
+@atexit.register
+def _close_managers() -> None:
+    for manager in _managers.values():
+        manager.close()
+    _managers.clear()
+
+
 @app.command("build")
 def build_index(
     code_paths: list[str] = code_paths_option(),  # noqa B008
@@ -33,14 +109,9 @@ def build_index(
     try:
         db_path = db_path or _get_default_db_path()
 
-        # Ensure .codescout directory exists
-        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        _ensure_db_dir(db_path)
 
-        config = CodeIndexConfig(
-            db_path=db_path,
-            file_extensions=file_extensions,
-        )
-        manager = CodeIndexManager(config)
+        manager = _manager_for(db_path, file_extensions)
 
         echo_info("Building code index...")
         echo_info(f"Code paths: {', '.join(code_paths)}")
@@ -51,6 +122,7 @@ def build_index(
         result = manager.build_index(
             code_paths=code_paths,
             print_file_paths=print_file_paths,
+            workers=os.cpu_count(),
         )
 
         if result.success:
@@ -73,13 +145,12 @@ def update_file(
     try:
         db_path = db_path or _get_default_db_path()
 
-        if not Path(db_path).exists():
+        if not _db_exists(db_path):
             echo_warning(f"Code index not found at {db_path}")
             echo_info("Run 'codescout index build' to create the index")
             return
 
-        config = CodeIndexConfig(db_path=db_path)
-        manager = CodeIndexManager(config)
+        manager = _manager_for(db_path)
 
         result = manager.update_file(file_path)
 
@@ -106,14 +177,9 @@ def rebuild_index(
     try:
         db_path = db_path or _get_default_db_path()
 
-        # Ensure .codescout directory exists
-        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        _ensure_db_dir(db_path)
 
-        config = CodeIndexConfig(
-            db_path=db_path,
-            file_extensions=file_extensions,
-        )
-        manager = CodeIndexManager(config)
+        manager = _manager_for(db_path, file_extensions)
 
         echo_info("Rebuilding code index...")
         echo_info(f"Code paths: {', '.join(code_paths)}")
@@ -124,6 +190,7 @@ def rebuild_index(
         result = manager.rebuild_index(
             code_paths=code_paths,
             print_file_paths=print_file_paths,
+            workers=os.cpu_count(),
         )
 
         if result.success:
@@ -138,60 +205,52 @@ def rebuild_index(
 
 
 @app.command("search")
-def search_symbols(
+def search_symbols(  # noqa: PLR0913, PLR0917
     query: str = typer.Argument(..., help="Search query for symbols"),
     symbol_type: str | None = typer.Option(
         None, "--type", help="Filter by symbol type (function, class, method, variable)"
     ),
     file_pattern: str | None = typer.Option(None, "--file", help="Filter by file path pattern"),
     json_output: bool = typer.Option(False, "--json", help="Output results in JSON format"),
+    jsonl_output: bool = typer.Option(False, "--jsonl", help="Output results as JSON Lines, one symbol per line"),
+    limit: int = typer.Option(20, "--limit", min=1, help="Maximum number of symbols to return"),
 ) -> None:
     """Search for code symbols."""
     try:
         db_path = _get_default_db_path()
 
-        if not Path(db_path).exists():
+        if not _db_exists(db_path):
             echo_warning(f"Code index not found at {db_path}")
             echo_info("Run 'codescout index build' to create the index")
             return
 
-        config = CodeIndexConfig(db_path=db_path)
-        manager = CodeIndexManager(config)
+        manager = _manager_for(db_path)
 
-        query_obj = CodeIndexQuery(text=query, symbol_type=symbol_type, file_pattern=file_pattern, limit=20)
+        query_obj = CodeIndexQuery(text=query, symbol_type=symbol_type, file_pattern=file_pattern, limit=limit)
 
-        results = manager.search_symbols(query_obj)
-
-        if json_output:
-            output = [
-                {
-                    "id": symbol.id,
-                    "name": symbol.name,
-                    "symbol_type": symbol.symbol_type,
-                    "language": symbol.language,
-                    "file_path": symbol.file_path,
-                    "line": symbol.start_line_number,
-                    "signature": symbol.signature,
-                    "docstring": symbol.docstring,
-                    "score": getattr(symbol, "score", 0),
-                    "reasons": getattr(symbol, "reasons", []),
-                }
-                for symbol in results
-            ]
-            echo_info(json.dumps(output, indent=2))
+        # JSON output is written symbol by symbol while the rows are read, so memory use doesn't grow
+        # with --limit
+        if jsonl_output:
+            for symbol in manager.iter_search_symbols(query_obj):
+                typer.echo(_dumps(_symbol_to_dict(symbol), indent=False))
+        elif json_output:
+            _echo_json_array(_symbol_to_dict(symbol) for symbol in manager.iter_search_symbols(query_obj))
         else:
+            results = manager.search_symbols(query_obj)
             if not results:
                 echo_warning("No symbols found matching the query")
                 return
 
-            echo_info(f"Found {len(results)} symbols:")
+            # Collected and written at once rather than with a write per line
+            lines = [f"Found {len(results)} symbols:"]
             for symbol in results:
-                echo_info(f"  {symbol.symbol_type}: {symbol.name} ({symbol.file_path}:{symbol.start_line_number})")
+                lines.append(f"  {symbol.symbol_type}: {symbol.name} ({symbol.file_path}:{symbol.start_line_number})")
                 if symbol.signature:
-                    echo_info(f"    Signature: {symbol.signature}")
+                    lines.append(f"    Signature: {symbol.signature}")
                 score = getattr(symbol, "score", None)
                 if score is not None:
-                    echo_info(f"    Score: {score:.2f}")
+                    lines.append(f"    Score: {score:.2f}")
+            echo_info("\n".join(lines))
 
     except Exception as e:
         handle_cli_exception(e, message="Error searching code index")
@@ -205,35 +264,37 @@ def show_stats(
     try:
         db_path = db_path or _get_default_db_path()
 
-        if not Path(db_path).exists():
+        if not _db_exists(db_path):
             echo_warning(f"Code index not found at {db_path}")
             echo_info("Run 'codescout index build' to create the index")
             return
 
-        config = CodeIndexConfig(db_path=db_path)
-        manager = CodeIndexManager(config)
+        manager = _manager_for(db_path)
 
         stats = manager.get_index_stats()
 
-        echo_info("Code Index Statistics:")
-        echo_info(f"  Database: {db_path}")
-        echo_info(f"  Total symbols: {stats.total_symbols}")
-        echo_info(f"  Total files: {stats.total_files}")
+        # Collected and written at once rather than with a write per line
+        lines = [
+            "Code Index Statistics:",
+            f"  Database: {db_path}",
+            f"  Total symbols: {stats.total_symbols}",
+            f"  Total files: {stats.total_files}",
+        ]
 
         # Show languages
         if stats.symbols_by_language:
             languages = list(stats.symbols_by_language.keys())
-            echo_info(f"  Languages: {', '.join(languages)}")
+            lines.append(f"  Languages: {', '.join(languages)}")
 
         if stats.last_updated:
-            echo_info(f"  Last updated: {stats.last_updated}")
+            lines.append(f"  Last updated: {stats.last_updated}")
 
-        echo_info("\nSymbol types:")
+        lines.append("\nSymbol types:")
         if stats.symbols_by_type:
-            for symbol_type, count in stats.symbols_by_type.items():
-                echo_info(f"  {symbol_type}: {count}")
+            lines.extend(f"  {symbol_type}: {count}" for symbol_type, count in stats.symbols_by_type.items())
         else:
-            echo_info("  No symbols found")
+            lines.append("  No symbols found")
+        echo_info("\n".join(lines))
 
     except Exception as e:
         handle_cli_exception(e, message="Error retrieving code index statistics")
@@ -248,19 +309,18 @@ def list_symbol_types(
     try:
         db_path = db_path or _get_default_db_path()
 
-        if not Path(db_path).exists():
+        if not _db_exists(db_path):
             echo_warning(f"Code index not found at {db_path}")
             echo_info("Run 'codescout index build' to create the index")
             return
 
-        config = CodeIndexConfig(db_path=db_path)
-        manager = CodeIndexManager(config)
+        manager = _manager_for(db_path)
 
         # Get distinct symbol types from the database
         symbol_types = manager.get_symbol_types()
 
         if json_output:
-            print(json.dumps({"symbol_types": symbol_types}, indent=2))
+            print(_dumps({"symbol_types": symbol_types}))
         elif symbol_types:
             echo_info("Available symbol types:")
             for symbol_type in sorted(symbol_types):
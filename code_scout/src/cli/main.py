@@ -1,28 +1,23 @@
 """CLI interface for Code Scout."""
 
-import os
-
 import typer
-from dotenv import load_dotenv
 
 from cli.cli_config import cli_config
-from cli.code_scout_context import CodeScoutContext
-from cli.git_cli import git_app as git_app
-from cli.github_cli import app as github_app
-from core.llm_providers.langchain_provider import LangChainProvider
-from src.cli.cli_options import (
+from cli.cli_options import (
     claude_api_key_option,
     env_file_option,
     model_option,
     openai_api_key_option,
     openrouter_api_key_option,
+    version_option,
 )
-from src.cli.cli_utils import echo_debug, handle_cli_exception
-
-# Load default .env file at module import time
-_ = load_dotenv()
+from cli.cli_utils import SubcommandArgsGroup, echo_debug, handle_cli_exception, is_help_requested
+from cli.code_scout_context import CodeScoutContext
+from cli.git_cli import git_app as git_app
+from cli.github_cli import app as github_app
 
 app = typer.Typer(
+    cls=SubcommandArgsGroup,
     help="Code Scout CLI for automated code reviews.",
     no_args_is_help=True,
     pretty_exceptions_short=False,
@@ -47,14 +42,18 @@ def main(  # noqa: PLR0913
         (Can be set via CODESCOUT_DEBUG env variable or --debug flag)
         """,
     ),
+    _version: bool = version_option(),
 ) -> None:
     """
     Code Scout CLI for automated code reviews.
     """
+    # Help for a subcommand needs neither the LLM context nor its validation
+    if is_help_requested(ctx):
+        return
 
     echo_debug(f"loaded dotenv from: {_env_file}")
     # Set the debug flag in the centralized config
-    cli_config.is_debug = debug or os.getenv("CODESCOUT_DEBUG", "false").lower() == "true"
+    cli_config.is_debug = debug
 
     ctx.obj = CodeScoutContext(
         model=model,
@@ -63,6 +62,9 @@ def main(  # noqa: PLR0913
         claude_api_key=claude_api_key,
     )
 
+    # Imported here rather than at the top so that --help doesn't load the LLM SDKs
+    from core.llm_providers.langchain_provider import LangChainProvider  # noqa: PLC0415
+
     try:
         LangChainProvider().validate_cli_context(ctx.obj)
     except Exception as e:
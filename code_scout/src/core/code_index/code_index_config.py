@@ -1,15 +1,26 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+# Dots and whitespace are dropped from configured extensions in a single pass
+_EXTENSION_STRIP_TABLE = str.maketrans("", "", ". \t\n\r")
+
+
+@dataclass(frozen=True, slots=True)
 class CodeIndexConfig:
     """Simplified configuration class for the code index service."""
 
-    db_path: str
-    file_extensions: list[str]
+    db_path: str = "./.codescout/code_index.db"
+    # Stored lowercase without the dot; a set, as every scanned file is checked against it
+    file_extensions: frozenset[str] = frozenset()
 
     def __init__(
         self,
         db_path: str = "./.codescout/code_index.db",
-        file_extensions: list[str] | None = None,
+        file_extensions: Iterable[str] | None = None,
     ):
-        self.db_path = db_path
-        self.file_extensions = (
-            [extension.replace(".", "").strip() for extension in file_extensions] if file_extensions else []
+        object.__setattr__(self, "db_path", db_path)
+        object.__setattr__(
+            self,
+            "file_extensions",
+            frozenset(extension.translate(_EXTENSION_STRIP_TABLE).lower() for extension in file_extensions or ()),
         )
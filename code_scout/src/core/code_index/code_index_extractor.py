@@ -1,5 +1,7 @@
 import hashlib
-from pathlib import Path
+import os
+from collections.abc import Mapping
+from types import MappingProxyType
 
 from tree_sitter import Language, Node, Parser, Point, Query, QueryCursor
 from tree_sitter_language_pack import SupportedLanguage, get_language
@@ -7,6 +9,16 @@ from tree_sitter_language_pack import SupportedLanguage, get_language
 from core.code_index.models import CodeSymbol
 from core.code_index.queries import QUERIES
 
+# Languages by lowercase file extension; shared by all extractors, as it never changes
+EXTENSION_LANGUAGES: Mapping[str, SupportedLanguage] = MappingProxyType(
+    {
+        ".py": "python",
+        ".js": "javascript",
+        ".ts": "typescript",
+        ".dart": "dart",
+    }
+)
+
 
 class CodeIndexExtractor:
     """
@@ -14,15 +26,11 @@ class CodeIndexExtractor:
     """
 
     def __init__(self):
-        """Initialize the extractor with lazy-loaded parsers and languages."""
+        """Initialize the extractor with lazy-loaded parsers, languages and queries."""
         self.parsers: dict[str, Parser] = {}
         self.languages: dict[str, Language] = {}
-        self.extension_map: dict[str, SupportedLanguage] = {
-            ".py": "python",
-            ".js": "javascript",
-            ".ts": "typescript",
-            ".dart": "dart",
-        }
+        self.queries: dict[str, Query] = {}
+        self.extension_map: Mapping[str, SupportedLanguage] = EXTENSION_LANGUAGES
 
     def extract_symbols(self, file_path: str, content: str) -> list[CodeSymbol]:  # noqa: PLR0912, PLR0915
         """
@@ -46,8 +54,7 @@ class CodeIndexExtractor:
             #     f"\n--- S-expression for {file_path} \n--------------\n\n----------------------------------"
             # )
 
-            query_src = QUERIES[language_name]
-            query = Query(language, query_src)
+            query = self._get_query(language_name, language)
             query_cursor = QueryCursor(query)
             matches = query_cursor.matches(tree.root_node)
 
@@ -148,8 +155,8 @@ class CodeIndexExtractor:
             return []
 
     def detect_language(self, file_path: str) -> SupportedLanguage | None:
-        path = Path(file_path)
-        return self.extension_map.get(path.suffix.lower())
+        # Called for every scanned file, so the extension is split off without building a Path
+        return self.extension_map.get(os.path.splitext(file_path)[1].lower())
 
     def _get_parser(self, language_name: SupportedLanguage) -> Parser | None:
         if language_name in self.parsers:
@@ -165,6 +172,12 @@ class CodeIndexExtractor:
             print(f"Failed to load parser for {language_name}: {e}")
             return None
 
+    def _get_query(self, language_name: SupportedLanguage, language: Language) -> Query:
+        # Compiling a query takes milliseconds, often longer than parsing the file it runs on
+        if language_name not in self.queries:
+            self.queries[language_name] = Query(language, QUERIES[language_name])
+        return self.queries[language_name]
+
     def _get_language(self, language_name: SupportedLanguage) -> Language | None:
         if language_name in self.languages:
             return self.languages[language_name]
@@ -1,5 +1,9 @@
 import hashlib
 import os
+import re
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Any, Callable
 
@@ -11,6 +15,12 @@ from core.code_index.code_index_extractor import CodeIndexExtractor
 from core.code_index.code_index_repository import CodeIndexRepository
 from core.code_index.models import CodeIndexQuery, CodeSymbol, IndexResult, IndexStats, UpdateResult
 
+# Starting worker processes only pays off when each of them has a fair number of files to parse
+_MIN_FILES_PER_WORKER = 16
+_WORKER_CHUNK_SIZE = 16
+# Files whose symbols are written to the database together, in one transaction
+_INSERT_CHUNK_FILES = 256
+
 
 class CodeIndexManager:
     """
@@ -29,14 +39,24 @@ class CodeIndexManager:
         self.repository = CodeIndexRepository(config.db_path)
         self.extractor = CodeIndexExtractor()
 
+    def close(self) -> None:
+        """Closes the database connections held by the repository."""
+        self.repository.close()
+
     def build_index(
         self,
         code_paths: list[str],
         print_file_paths: bool,
+        workers: int | None = None,
     ) -> IndexResult:
         """
         Builds the code index for the configured code paths.
 
+        Arguments:
+            code_paths: The code paths to index.
+            print_file_paths: whether to print paths of files that are being indexed.
+            workers: Maximum number of processes parsing files in parallel. Defaults to 1.
+
         Returns:
             An IndexResult object indicating success or failure and statistics.
         """
@@ -44,6 +64,7 @@ class CodeIndexManager:
         return self._index_code_paths(
             code_paths=code_paths,
             print_file_paths=print_file_paths,
+            workers=workers or 1,
         )
 
     def update_file(self, file_path: str) -> UpdateResult:
@@ -89,6 +110,7 @@ class CodeIndexManager:
         self,
         code_paths: list[str],
         print_file_paths: bool,
+        workers: int | None = None,
     ) -> IndexResult:
         """
         Rebuilds the entire code index from scratch for the configured code paths.
@@ -96,6 +118,7 @@ class CodeIndexManager:
         Arguments:
             code_paths: The code paths to rebuild.
             print_file_paths: whether to print paths of files that are being rebuilt.
+            workers: Maximum number of processes parsing files in parallel. Defaults to 1.
 
         Returns:
             An IndexResult object indicating success or failure and statistics.
@@ -104,6 +127,7 @@ class CodeIndexManager:
         return self._index_code_paths(
             code_paths=code_paths,
             print_file_paths=print_file_paths,
+            workers=workers or 1,
         )
 
     def search_symbols(self, query: CodeIndexQuery) -> list[CodeSymbol]:
@@ -116,13 +140,19 @@ class CodeIndexManager:
         Returns:
             A list of CodeSymbol objects matching the query.
         """
-        filters = {
-            "symbol_type": query.symbol_type,
-            "file_pattern": query.file_pattern,
-            "language": query.language,
-            "limit": query.limit,
-        }
-        return self.repository.search_fts(query.text, filters)
+        return self.repository.search_fts(query.text, _query_filters(query))
+
+    def iter_search_symbols(self, query: CodeIndexQuery) -> Iterator[CodeSymbol]:
+        """
+        Searches for code symbols in the index, yielding them as they are read from the database.
+
+        Args:
+            query: A CodeIndexQuery object specifying the search criteria.
+
+        Returns:
+            An iterator over the CodeSymbol objects matching the query.
+        """
+        return self.repository.iter_search_fts(query.text, _query_filters(query))
 
     def get_index_stats(self) -> IndexStats:
         """
@@ -164,55 +194,109 @@ class CodeIndexManager:
         self,
         code_paths: list[str],
         print_file_paths: bool,
+        workers: int,
     ) -> IndexResult:
         """
-        Internal method to index a list of code paths.
+        Internal method to index a list of code paths. Files are parsed in up to `workers` processes,
+        and their symbols are written to the database in chunks of _INSERT_CHUNK_FILES files.
         """
-        total_symbols_indexed = 0
-        total_files_processed = 0
-        errors: list[str] = []
-
-        for code_path in code_paths:
-            repo_path_obj = Path(code_path)
-            if not repo_path_obj.exists():
-                errors.append(f"Code path does not exist: {code_path}")
-                continue
-
-            gitignore_path = repo_path_obj / ".gitignore"
-            matches: Callable[..., bool] | None = (  # pyright: ignore[reportUnknownVariableType]
-                parse_gitignore(gitignore_path, repo_path_obj.as_posix()) if gitignore_path.exists() else None
-            )
-
-            for file_path_str in self._scan_files(code_path, matches):
-                relative_file_path = str(Path(file_path_str).relative_to(repo_path_obj))
-
-                total_files_processed += 1
-                try:
-                    if print_file_paths:
-                        echo_info(file_path_str)
-                    current_hash = _calculate_file_hash(file_path_str)
-                    with open(file_path_str, "r", encoding="utf-8", errors="ignore") as f:
-                        content = f.read()
+        with self.repository.bulk_writes():
+            total_symbols_indexed = 0
+            total_files_processed = 0
+            errors: list[str] = []
+            # Parsed files not written yet, with the paths they were read from
+            pending_files: list[tuple[str, str, list[CodeSymbol]]] = []
+            pending_file_paths: list[str] = []
+
+            for code_path in code_paths:
+                repo_path_obj = Path(code_path)
+                if not repo_path_obj.exists():
+                    errors.append(f"Code path does not exist: {code_path}")
+                    continue
 
-                    symbols = self.extractor.extract_symbols(file_path_str, content)
+                gitignore_path = repo_path_obj / ".gitignore"
+                matches: Callable[..., bool] | None = (  # pyright: ignore[reportUnknownVariableType]
+                    parse_gitignore(gitignore_path, repo_path_obj.as_posix()) if gitignore_path.exists() else None
+                )
+
+                file_paths = self._scan_files(code_path, matches)
+                total_files_processed += len(file_paths)
+                for file_path_str, result in zip(
+                    file_paths, self._extract_files(file_paths, print_file_paths, workers), strict=True
+                ):
+                    if isinstance(result, str):
+                        errors.append(f"Error processing file {file_path_str}: {result}")
+                        continue
 
+                    current_hash, symbols = result
+                    relative_file_path = str(Path(file_path_str).relative_to(repo_path_obj))
                     for symbol in symbols:
                         symbol.file_path = relative_file_path
                         symbol.file_hash = current_hash
+                    pending_files.append((relative_file_path, current_hash, symbols))
+                    pending_file_paths.append(file_path_str)
+                    if len(pending_files) >= _INSERT_CHUNK_FILES:
+                        total_symbols_indexed += self._write_indexed_files(pending_files, pending_file_paths, errors)
+                        pending_files, pending_file_paths = [], []
+
+            total_symbols_indexed += self._write_indexed_files(pending_files, pending_file_paths, errors)
+
+            return IndexResult(
+                success=not errors,
+                message="Index built successfully" if not errors else "Index built with errors",
+                symbols_indexed=total_symbols_indexed,
+                files_processed=total_files_processed,
+                errors=errors,
+            )
 
-                    self.repository.insert_symbols(symbols)
-                    self.repository.update_file_tracking(relative_file_path, current_hash, len(symbols))
-                    total_symbols_indexed += len(symbols)
+    def _write_indexed_files(
+        self,
+        indexed_files: list[tuple[str, str, list[CodeSymbol]]],
+        file_paths: list[str],
+        errors: list[str],
+    ) -> int:
+        """
+        Writes a chunk of indexed files in one transaction. If that fails, the files are written one by one,
+        so only the files that can't be written are left out and reported in `errors`.
+        Returns the number of symbols written.
+        """
+        try:
+            self.repository.insert_indexed_files(indexed_files)
+            return sum(len(symbols) for _, _, symbols in indexed_files)
+        except Exception:
+            symbols_indexed = 0
+            for indexed_file, file_path_str in zip(indexed_files, file_paths, strict=True):
+                try:
+                    self.repository.insert_indexed_files([indexed_file])
+                    symbols_indexed += len(indexed_file[2])
                 except Exception as e:
                     errors.append(f"Error processing file {file_path_str}: {e}")
+            return symbols_indexed
 
-        return IndexResult(
-            success=not errors,
-            message="Index built successfully" if not errors else "Index built with errors",
-            symbols_indexed=total_symbols_indexed,
-            files_processed=total_files_processed,
-            errors=errors,
-        )
+    def _extract_files(
+        self,
+        file_paths: list[str],
+        print_file_paths: bool,
+        workers: int,
+    ) -> Iterator[tuple[str, list[CodeSymbol]] | str]:
+        """
+        Parses the files, in worker processes when there are enough of them. Yields (file hash, symbols)
+        for each file in order, or the error message if the file could not be processed.
+        """
+        workers = min(workers, len(file_paths) // _MIN_FILES_PER_WORKER)
+        if workers <= 1:
+            for file_path_str in file_paths:
+                if print_file_paths:
+                    echo_info(file_path_str)
+                yield _extract_file(file_path_str, self.extractor)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_extract_file, file_paths, repeat(None), chunksize=_WORKER_CHUNK_SIZE)
+            for file_path_str, result in zip(file_paths, results, strict=True):
+                if print_file_paths:
+                    echo_info(file_path_str)
+                yield result
 
     def _scan_files(self, code_path: str, gitignore_matches: Any) -> list[str]:
         """
@@ -220,8 +304,15 @@ class CodeIndexManager:
         """
         file_paths: list[str] = []
         code_path_obj = Path(code_path)
+        matches_extension = (
+            _compile_extension_pattern(self.config.file_extensions).match if self.config.file_extensions else None
+        )
         for root, _, files in os.walk(code_path):
             for file in files:
+                # Checked on the bare file name first, as most files of a tree are usually filtered out here
+                if matches_extension and not matches_extension(file):
+                    continue
+
                 file_path = Path(root) / file
                 file_path_str = file_path.as_posix()
                 relative_to_code_path = file_path.relative_to(code_path_obj).as_posix()
@@ -229,11 +320,6 @@ class CodeIndexManager:
                 if gitignore_matches and gitignore_matches(relative_to_code_path):
                     continue
 
-                if self.config.file_extensions:
-                    file_extension = file_path.suffix.lstrip(".")
-                    if file_extension not in self.config.file_extensions:
-                        continue
-
                 if not self.extractor.detect_language(file_path_str):
                     continue
 
@@ -241,6 +327,22 @@ class CodeIndexManager:
         return file_paths
 
 
+def _compile_extension_pattern(file_extensions: frozenset[str]) -> re.Pattern[str]:
+    """Compiles a pattern matching file names that end with one of the given extensions, in any case."""
+    alternatives = "|".join(sorted(map(re.escape, file_extensions)))
+    return re.compile(rf".+\.(?:{alternatives})\Z", re.IGNORECASE | re.DOTALL)
+
+
+def _query_filters(query: CodeIndexQuery) -> dict[str, Any]:
+    """Converts a query into the search filters of the repository."""
+    return {
+        "symbol_type": query.symbol_type,
+        "file_pattern": query.file_pattern,
+        "language": query.language,
+        "limit": query.limit,
+    }
+
+
 def _calculate_file_hash(file_path: str) -> str:
     """Calculates the SHA256 hash of a file's content."""
     hasher = hashlib.sha256()
@@ -248,3 +350,25 @@ def _calculate_file_hash(file_path: str) -> str:
         while chunk := f.read(8192):
             hasher.update(chunk)
     return hasher.hexdigest()
+
+
+# Extractor of a worker process, created on its first file
+_worker_extractor: CodeIndexExtractor | None = None
+
+
+def _extract_file(file_path: str, extractor: CodeIndexExtractor | None) -> tuple[str, list[CodeSymbol]] | str:
+    """
+    Hashes a file and extracts its symbols. Runs in worker processes, so failures are returned as the
+    error message instead of being raised.
+    """
+    global _worker_extractor  # noqa: PLW0603
+    if extractor is None:
+        _worker_extractor = _worker_extractor or CodeIndexExtractor()
+        extractor = _worker_extractor
+    try:
+        current_hash = _calculate_file_hash(file_path)
+        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+            content = f.read()
+        return current_hash, extractor.extract_symbols(file_path, content)
+    except Exception as e:
+        return str(e)
@@ -1,10 +1,30 @@
+import re
 import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from .models import CodeSymbol, IndexStats
 
+_GLOB_WILDCARDS = re.compile(r"[*?]")
+
+_INSERT_SYMBOL_SQL = """
+    INSERT OR REPLACE INTO code_index (
+        name, symbol_type, file_path, line_number, column_number,
+        end_line_number, end_column_number, language, signature,
+        docstring, parent_symbol, scope, parameters, return_type,
+        file_hash, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_FILE_TRACKING_SQL = """
+    INSERT OR REPLACE INTO indexed_files (file_path, file_hash, symbol_count, last_indexed)
+    VALUES (?, ?, ?, ?)
+"""
+
 
 class CodeIndexRepository:
     """Manages SQLite database operations for the code index service."""
@@ -18,6 +38,10 @@ class CodeIndexRepository:
             db_path: Path to the SQLite database file
         """
         self.db_path = db_path
+        # SQLite connections can't be shared between threads, so each thread keeps its own
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
         self.initialize_database()
 
     def initialize_database(self) -> None:
@@ -139,8 +163,13 @@ class CodeIndexRepository:
             conn.commit()
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get and configure a new SQLite connection with optimizations."""
-        conn = sqlite3.connect(self.db_path)
+        """Get the current thread's SQLite connection, opening and configuring it on first use."""
+        conn: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if conn is not None:
+            return conn
+
+        # Only the owning thread uses the connection, but close() may run on another thread
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
 
         # Apply SQLite optimization pragmas
@@ -150,47 +179,67 @@ class CodeIndexRepository:
         _ = cursor.execute("PRAGMA temp_store=MEMORY")
         _ = cursor.execute("PRAGMA cache_size=-20000")
 
+        self._local.connection = conn
+        with self._connections_lock:
+            self._connections.append(conn)
         return conn
 
+    def close(self) -> None:
+        """
+        Close all connections opened by this repository, including those of other threads.
+        A later operation opens a new one.
+        """
+        with self._connections_lock:
+            connections = self._connections
+            self._connections = []
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
+
     def insert_symbols(self, symbols: list[CodeSymbol]) -> None:
         """Insert a batch of symbols using a transaction."""
         if not symbols:
             return
 
         with self._get_connection() as conn:
-            cursor = conn.cursor()
+            _ = conn.executemany(_INSERT_SYMBOL_SQL, [_symbol_to_row(symbol) for symbol in symbols])
+            conn.commit()
 
-            for symbol in symbols:
-                _ = cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO code_index (
-                        name, symbol_type, file_path, line_number, column_number,
-                        end_line_number, end_column_number, language, signature,
-                        docstring, parent_symbol, scope, parameters, return_type,
-                        file_hash, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        symbol.name,
-                        symbol.symbol_type,
-                        symbol.file_path,
-                        symbol.start_line_number,
-                        symbol.start_column_number,
-                        symbol.end_line_number,
-                        symbol.end_column_number,
-                        symbol.language,
-                        symbol.signature,
-                        symbol.docstring,
-                        symbol.parent_symbol,
-                        symbol.scope,
-                        symbol.parameters,
-                        symbol.return_type,
-                        symbol.file_hash,
-                        datetime.now(),
-                    ),
-                )
+    def insert_indexed_files(self, indexed_files: list[tuple[str, str, list[CodeSymbol]]]) -> None:
+        """
+        Insert the symbols and tracking rows of several files in a single transaction.
 
-            conn.commit()
+        Args:
+            indexed_files: (file_path, file_hash, symbols) for each indexed file
+        """
+        if not indexed_files:
+            return
+
+        now = datetime.now()
+        with self._get_connection() as conn:
+            _ = conn.executemany(
+                _INSERT_SYMBOL_SQL,
+                [_symbol_to_row(symbol, now) for _, _, symbols in indexed_files for symbol in symbols],
+            )
+            _ = conn.executemany(
+                _INSERT_FILE_TRACKING_SQL,
+                [(file_path, file_hash, len(symbols), now) for file_path, file_hash, symbols in indexed_files],
+            )
+
+    @contextmanager
+    def bulk_writes(self) -> Iterator[None]:
+        """
+        Skip fsyncs on the current thread's connection within the block, e.g. while an index is built.
+        Nothing is lost if a build is interrupted, it is simply run again. The previous setting is
+        restored afterwards, as later operations reuse the connection.
+        """
+        conn = self._get_connection()
+        previous_synchronous: int = conn.execute("PRAGMA synchronous").fetchone()[0]
+        _ = conn.execute("PRAGMA synchronous=OFF")
+        try:
+            yield
+        finally:
+            _ = conn.execute(f"PRAGMA synchronous={previous_synchronous:d}")
 
     def delete_symbols_by_file(self, file_path: str) -> None:
         """Delete all symbols for a given file."""
@@ -208,6 +257,10 @@ class CodeIndexRepository:
 
     def search_fts(self, query: str, filters: dict[str, Any]) -> list[CodeSymbol]:
         """Perform a search against the FTS table with optional filters."""
+        return list(self.iter_search_fts(query, filters))
+
+    def iter_search_fts(self, query: str, filters: dict[str, Any]) -> Iterator[CodeSymbol]:
+        """Like search_fts, but yields the symbols as the rows are read instead of fetching them all first."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
@@ -227,9 +280,16 @@ class CodeIndexRepository:
                 sql += " AND ci.symbol_type = ?"
                 params.append(filters["symbol_type"])
 
-            if filters.get("file_pattern"):
-                sql += " AND ci.file_path LIKE ?"
-                params.append(f"%{filters['file_pattern']}%")
+            if file_pattern := filters.get("file_pattern"):
+                # Glob patterns such as '*.py' or 'src/*' are matched by SQLite's GLOB, anything else is
+                # a substring of the path. Both ignore case. Brackets are literal path characters, e.g. in
+                # 'app/[id]/*.tsx', so GLOB gets them as the one-character class '[[]'.
+                if _GLOB_WILDCARDS.search(file_pattern):
+                    sql += " AND lower(ci.file_path) GLOB lower(?)"
+                    params.append(file_pattern.replace("[", "[[]"))
+                else:
+                    sql += " AND ci.file_path LIKE ?"
+                    params.append(f"%{file_pattern}%")
 
             if filters.get("language"):
                 sql += " AND ci.language = ?"
@@ -240,9 +300,8 @@ class CodeIndexRepository:
             params.append(filters.get("limit", 20))
 
             _ = cursor.execute(sql, params)
-            rows = cursor.fetchall()
-
-            return [self._row_to_symbol(row) for row in rows]
+            for row in cursor:
+                yield self._row_to_symbol(row)
 
     def get_file_hash(self, file_path: str) -> str | None:
         """Retrieve the stored hash for a file."""
@@ -257,10 +316,7 @@ class CodeIndexRepository:
         with self._get_connection() as conn:
             cursor = conn.cursor()
             _ = cursor.execute(
-                """
-                INSERT OR REPLACE INTO indexed_files (file_path, file_hash, symbol_count, last_indexed)
-                VALUES (?, ?, ?, ?)
-            """,
+                _INSERT_FILE_TRACKING_SQL,
                 (file_path, file_hash, symbol_count, datetime.now()),
             )
             conn.commit()
@@ -407,3 +463,25 @@ class CodeIndexRepository:
             created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else None,
             updated_at=datetime.fromisoformat(row["updated_at"]) if row["updated_at"] else None,
         )
+
+
+def _symbol_to_row(symbol: CodeSymbol, updated_at: datetime | None = None) -> tuple[Any, ...]:
+    """Convert a symbol to the parameters of _INSERT_SYMBOL_SQL."""
+    return (
+        symbol.name,
+        symbol.symbol_type,
+        symbol.file_path,
+        symbol.start_line_number,
+        symbol.start_column_number,
+        symbol.end_line_number,
+        symbol.end_column_number,
+        symbol.language,
+        symbol.signature,
+        symbol.docstring,
+        symbol.parent_symbol,
+        symbol.scope,
+        symbol.parameters,
+        symbol.return_type,
+        symbol.file_hash,
+        updated_at or datetime.now(),
+    )
@@ -2,9 +2,10 @@ import os
 from typing import override
 
 import git
-from git import Diff, DiffIndex
+from git import Commit, Diff, DiffIndex
 from git.exc import GitCommandError
 
+from cli.cli_config import cli_config
 from cli.cli_utils import echo_debug, echo_warning
 from core.interfaces.diff_provider import DiffProvider
 from core.models.code_diff import CodeDiff
@@ -20,6 +21,10 @@ class GitDiffProvider(DiffProvider):
     source: str
     target: str
     staged: bool
+    # Results of the first get_diff call, reused by later calls on the same provider
+    _diffs: list[CodeDiff] | None
+    # Target commit resolved once per get_diff instead of once per file read
+    _target_commit: Commit | None
 
     def __init__(
         self,
@@ -32,6 +37,8 @@ class GitDiffProvider(DiffProvider):
         self.source = source
         self.target = target
         self.staged = staged
+        self._diffs = None
+        self._target_commit = None
         if not self.staged and source == target:
             raise ValueError("Source and target branches cannot be the same when not reviewing staged files.")
         if self.staged and source and target:
@@ -41,7 +48,25 @@ class GitDiffProvider(DiffProvider):
 
     @override
     def get_diff(self) -> list[CodeDiff]:
+        """
+        Collects the diffs once per provider; later calls return the same CodeDiff objects without
+        running git again.
+        """
+        if self._diffs is None:
+            self._diffs = self._collect_diffs()
+        return list(self._diffs)
+
+    def _collect_diffs(self) -> list[CodeDiff]:
+        # GitPython reads blobs through long-lived `git cat-file` processes owned by the Repo, so a single
+        # Repo serves every file of the diff; closing it stops those processes once the diffs are collected.
         repo = git.Repo(path=self.repo_path)
+        try:
+            return self._collect_diffs_from_repo(repo)
+        finally:
+            self._target_commit = None
+            repo.close()
+
+    def _collect_diffs_from_repo(self, repo: git.Repo) -> list[CodeDiff]:
         self._fetch_origin(repo)  # Fetch origin before getting the diff
         diff_index: DiffIndex[Diff] = self._get_diff_index(repo)
         echo_debug(f"found {len(diff_index)} changes")
@@ -73,7 +98,8 @@ class GitDiffProvider(DiffProvider):
                     change_type=change_type,
                     current_file_content=current_file_content,
                 )
-                echo_debug(f"Processed {file_path}: {change_type}")
+                if cli_config.is_debug:
+                    echo_debug(f"Processed {file_path}: {change_type}")
                 diff_list.append(code_diff)
 
         return diff_list
@@ -161,11 +187,11 @@ class GitDiffProvider(DiffProvider):
             if content is None:
                 return None
 
-            # Check if content is binary or too large
-            if CodeExcerptExtractor.is_binary_content(content):
+            # Check if content is too large or binary; the size check is the cheaper one
+            if CodeExcerptExtractor.is_file_too_large(content):
                 return None
 
-            if CodeExcerptExtractor.is_file_too_large(content):
+            if CodeExcerptExtractor.is_binary_content(content):
                 return None
 
             return content
@@ -199,8 +225,9 @@ class GitDiffProvider(DiffProvider):
     def _read_committed_file_content(self, repo: git.Repo, file_path: str) -> str | None:
         """Read file content from Git commit for committed files."""
         try:
-            target_commit = repo.commit(self.target)
-            file_content = target_commit.tree[file_path].data_stream.read()  # type: ignore
+            if self._target_commit is None:
+                self._target_commit = repo.commit(self.target)
+            file_content = self._target_commit.tree[file_path].data_stream.read()  # type: ignore
             return file_content.decode("utf-8", errors="replace")  # type: ignore
         except (KeyError, GitCommandError):
             echo_warning(f"File not found in target commit: {file_path}")
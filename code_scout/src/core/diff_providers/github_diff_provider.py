@@ -1,3 +1,5 @@
+import threading
+from concurrent.futures import Future
 from typing import override
 
 from core.interfaces.diff_provider import DiffProvider
@@ -12,6 +14,8 @@ class GitHubDiffProvider(DiffProvider):
     repo_name: str
     pr_number: int
     github_service: GitHubService
+    # Set by prefetch(); get_diff() then waits for this result instead of fetching again
+    _prefetched_diffs: Future[list[CodeDiff]] | None
 
     def __init__(
         self,
@@ -19,6 +23,7 @@ class GitHubDiffProvider(DiffProvider):
         repo_name: str,
         pr_number: int,
         github_token: str,
+        github_service: GitHubService | None = None,
     ) -> None:
         if not repo_owner:
             raise ValueError("Repository owner cannot be empty.")
@@ -32,10 +37,37 @@ class GitHubDiffProvider(DiffProvider):
         self.repo_owner = repo_owner
         self.repo_name = repo_name
         self.pr_number = pr_number
-        self.github_service = GitHubService(github_token, repo_owner, repo_name)
+        # An existing service for the same repository (e.g. from interactive review) is reused, which
+        # skips a second client, connection and repository lookup
+        self.github_service = github_service or GitHubService(github_token, repo_owner, repo_name)
+        self._prefetched_diffs = None
+
+    def prefetch(self) -> None:
+        """
+        Starts fetching the diff in the background, e.g. while the user is still confirming the review.
+        The fetch runs on a daemon thread, so abandoning it (the user cancels) doesn't delay exit.
+        """
+        if self._prefetched_diffs is not None:
+            return
+        future: Future[list[CodeDiff]] = Future()
+        self._prefetched_diffs = future
+
+        def fetch() -> None:
+            _ = future.set_running_or_notify_cancel()
+            try:
+                future.set_result(self._fetch_diff())
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=fetch, name="codescout-diff-prefetch", daemon=True).start()
 
     @override
     def get_diff(self) -> list[CodeDiff]:
+        if self._prefetched_diffs is not None:
+            return list(self._prefetched_diffs.result())
+        return self._fetch_diff()
+
+    def _fetch_diff(self) -> list[CodeDiff]:
         pull = self.github_service.get_pull_request(self.pr_number)
 
         code_diffs: list[CodeDiff] = []
@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from langchain_core.language_models import BaseLanguageModel
+from cli.code_scout_context import CodeScoutContext
 
-from src.cli.code_scout_context import CodeScoutContext
+if TYPE_CHECKING:
+    # Only needed for annotations; importing it pulls in LangSmith, which is slow to load
+    from langchain_core.language_models import BaseLanguageModel
 
 
 class LLMProvider(ABC):
@@ -16,7 +18,7 @@ class LLMProvider(ABC):
     def get_llm(
         self,
         code_scout_context: CodeScoutContext,
-    ) -> BaseLanguageModel[Any]:
+    ) -> "BaseLanguageModel[Any]":
         """
         Retrieves a Language Model instance based on the provided model string and API keys.
         """
@@ -1,4 +1,6 @@
+import sys
 from abc import ABC, abstractmethod
+from typing import TextIO
 
 from core.models.review_result import ReviewResult
 
@@ -11,6 +13,10 @@ class ReviewFormatter(ABC):
         """Format the review result for output."""
         pass
 
+    def write(self, result: ReviewResult, stream: TextIO | None = None) -> None:
+        """Write the formatted review result to the given stream, stdout by default."""
+        _ = (stream or sys.stdout).write(self.format(result))
+
     @abstractmethod
     def get_formatter_name(self) -> str:
         """Return the name of this formatter."""
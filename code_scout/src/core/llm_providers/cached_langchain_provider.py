@@ -0,0 +1,41 @@
+"""LangChain-based LLM provider with a persistent response cache."""
+
+from typing import Any, override
+
+from langchain_core.language_models import BaseLanguageModel
+
+from cli.code_scout_context import CodeScoutContext
+from core.llm_providers.langchain_provider import LangChainProvider
+from core.llm_providers.llm_response_cache import (
+    DEFAULT_LLM_CACHE_PATH,
+    DEFAULT_LLM_CACHE_TTL_SECONDS,
+    LLMResponseCache,
+)
+
+
+class CachedLangChainProvider(LangChainProvider):
+    """
+    LangChain provider whose models answer repeated requests from an on-disk cache,
+    e.g. when reviewing an unchanged working tree again.
+    """
+
+    cache_path: str
+    ttl_seconds: int
+
+    def __init__(
+        self,
+        cache_path: str = DEFAULT_LLM_CACHE_PATH,
+        ttl_seconds: int | None = None,
+    ):
+        self.cache_path = cache_path
+        self.ttl_seconds = DEFAULT_LLM_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+
+    @override
+    def get_llm(
+        self,
+        code_scout_context: CodeScoutContext,
+    ) -> BaseLanguageModel[Any]:
+        """Creates a LangChain Language Model that caches its responses."""
+        llm = super().get_llm(code_scout_context)
+        llm.cache = LLMResponseCache(db_path=self.cache_path, ttl_seconds=self.ttl_seconds)
+        return llm
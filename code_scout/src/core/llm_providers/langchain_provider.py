@@ -1,27 +1,32 @@
 """LangChain-based LLM provider implementation."""
 
 import os
-from typing import Any, override
+from typing import TYPE_CHECKING, Any, override
 
 import typer
-from langchain_anthropic import ChatAnthropic
-from langchain_core.language_models import BaseLanguageModel
-from langchain_openai import ChatOpenAI
 from pydantic import SecretStr
 
+from cli.cli_utils import echo_info, echo_warning
+from cli.code_scout_context import CodeScoutContext
 from core.interfaces.llm_provider import LLMProvider
-from src.cli.cli_utils import echo_info, echo_warning
-from src.cli.code_scout_context import CodeScoutContext
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseLanguageModel
 
 
 class LangChainProvider(LLMProvider):
-    """LLM provider that uses LangChain models directly."""
+    """
+    LLM provider that uses LangChain models directly.
+
+    The OpenAI and Anthropic integrations take seconds to import, so only the one the selected model needs
+    is imported, and only once a model is created. Validating the CLI context imports neither.
+    """
 
     @override
     def get_llm(
         self,
         code_scout_context: CodeScoutContext,
-    ) -> BaseLanguageModel[Any]:
+    ) -> "BaseLanguageModel[Any]":
         """Creates and returns a LangChain Language Model."""
         self.validate_cli_context(code_scout_context)
 
@@ -31,6 +36,8 @@ class LangChainProvider(LLMProvider):
         claude_api_key = code_scout_context.claude_api_key
 
         if model.startswith("openrouter/"):
+            from langchain_openai import ChatOpenAI  # noqa: PLC0415
+
             api_key = SecretStr(
                 openrouter_api_key or os.getenv("OPENROUTER_API_KEY") or "",
             )
@@ -41,6 +48,8 @@ class LangChainProvider(LLMProvider):
             )
 
         elif model.startswith("openai/"):
+            from langchain_openai import ChatOpenAI  # noqa: PLC0415
+
             api_key = SecretStr(openai_api_key or os.getenv("OPENAI_API_KEY") or "")
             return ChatOpenAI(
                 api_key=api_key,
@@ -48,6 +57,8 @@ class LangChainProvider(LLMProvider):
             )
 
         elif model.startswith("anthropic/"):
+            from langchain_anthropic import ChatAnthropic  # noqa: PLC0415
+
             api_key = SecretStr(claude_api_key or os.getenv("CLAUDE_API_KEY") or "")
             return ChatAnthropic(
                 api_key=api_key,
@@ -0,0 +1,107 @@
+"""SQLite-backed LangChain cache for LLM responses."""
+
+import hashlib
+import json
+import re
+import sqlite3
+import time
+from collections.abc import Sequence
+from contextlib import closing
+from pathlib import Path
+from typing import Any, override
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration
+
+# Bump whenever the stored format or the meaning of cached responses changes, so old entries stop matching
+CACHE_VERSION = "3"
+
+# Prompts arrive as serialized JSON, where line breaks and tabs are the escapes \n, \r and \t. Trailing
+# whitespace and CRLF line endings don't change what the model is asked to review, so they are
+# dropped from the key: whitespace before a line break or the closing quote of a string, and the \r of
+# a \r\n. Every other escape is matched as a whole and kept, so an escaped backslash followed by t, r
+# or n is never mistaken for a tab or line break.
+_KEY_NORMALIZATION = re.compile(r'(?: |\\t)+(?=\\r\\n|\\n|")|\\r(?=\\n)|(\\.)')
+
+DEFAULT_LLM_CACHE_PATH = "./.codescout/llm_cache.db"
+DEFAULT_LLM_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+class LLMResponseCache(BaseCache):
+    """
+    Persists chat model responses in a SQLite database, so re-reviewing unchanged code does not
+    hit the LLM again. Entries are keyed by a SHA-256 of the prompt and the model configuration
+    (model name, parameters and bound tools), and expire after `ttl_seconds`. Prompts that only
+    differ in trailing whitespace or line endings share an entry.
+    """
+
+    db_path: str
+    ttl_seconds: int
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_LLM_CACHE_PATH,
+        ttl_seconds: int = DEFAULT_LLM_CACHE_TTL_SECONDS,
+    ):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._get_connection()) as conn, conn:
+            _ = conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # A connection per operation keeps the cache usable from parallel review threads. Callers close it
+        # with contextlib.closing, as the connection's own context manager only commits.
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    @staticmethod
+    def _make_key(prompt: str, llm_string: str) -> str:
+        normalized_prompt = _KEY_NORMALIZATION.sub(r"\1", prompt)
+        return hashlib.sha256(f"{CACHE_VERSION}\0{llm_string}\0{normalized_prompt}".encode()).hexdigest()
+
+    @override
+    def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        """Returns the cached generations for the prompt, or None if there is no fresh entry."""
+        with closing(self._get_connection()) as conn, conn:
+            row = conn.execute(
+                "SELECT response FROM llm_cache WHERE key = ? AND created_at >= ?",
+                (self._make_key(prompt, llm_string), time.time() - self.ttl_seconds),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            messages = messages_from_dict(json.loads(row[0]))
+        except (ValueError, KeyError):
+            # Unreadable entries are treated as misses and overwritten by the next update
+            return None
+        return [ChatGeneration(message=message) for message in messages]
+
+    @override
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Stores the generations of a chat model response."""
+        if not _is_chat_response(return_val):
+            return
+        response = json.dumps([message_to_dict(generation.message) for generation in return_val])  # pyright: ignore[reportAttributeAccessIssue]
+        with closing(self._get_connection()) as conn, conn:
+            _ = conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, response, created_at) VALUES (?, ?, ?)",
+                (self._make_key(prompt, llm_string), response, time.time()),
+            )
+
+    @override
+    def clear(self, **kwargs: Any) -> None:
+        """Removes all cached responses."""
+        with closing(self._get_connection()) as conn, conn:
+            _ = conn.execute("DELETE FROM llm_cache")
+
+
+def _is_chat_response(return_val: Sequence[Any]) -> bool:
+    """Only chat model generations are cached; completion-style responses are not used by the reviews."""
+    return bool(return_val) and all(isinstance(generation, ChatGeneration) for generation in return_val)
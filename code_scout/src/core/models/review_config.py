@@ -1,7 +1,11 @@
 from enum import Enum
+from typing import TYPE_CHECKING
 
 from core.interfaces.langchain_review_tool import LangChainReviewTool
-from src.core.models.review_finding import Severity, Category
+from core.models.review_finding import Category, Severity
+
+if TYPE_CHECKING:
+    from core.review_chains.hunk_findings_cache import HunkFindingsCache
 
 
 class ReviewType(str, Enum):
@@ -14,6 +18,13 @@ class ReviewType(str, Enum):
     REFACTORING = "refactoring"
 
 
+# Upper bound for parallel LLM requests, to stay clear of provider rate limits
+MAX_REVIEW_CONCURRENCY = 8
+
+# Default number of tool calls from a single LLM turn that run at once, e.g. reading several files
+DEFAULT_TOOL_CONCURRENCY = 4
+
+
 class ReviewConfig:
     """Configuration for the code review pipeline."""
 
@@ -23,10 +34,13 @@ class ReviewConfig:
     context_lines_after: int
     max_excerpt_lines: int
     max_tool_calls_per_review: int
+    concurrency: int
+    tool_concurrency: int
     allowed_severities: list[str] | None = None
     banned_severities: list[str] | None = None
     allowed_categories: list[str] | None = None
     banned_categories: list[str] | None = None
+    findings_cache: "HunkFindingsCache | None" = None
 
     def __init__(  # noqa: PLR0913
         self,
@@ -40,7 +54,14 @@ class ReviewConfig:
         banned_severities: list[str] | None = None,
         allowed_categories: list[str] | None = None,
         banned_categories: list[str] | None = None,
+        concurrency: int = 1,
+        tool_concurrency: int = DEFAULT_TOOL_CONCURRENCY,
+        findings_cache: "HunkFindingsCache | None" = None,
     ):
+        if not 1 <= concurrency <= MAX_REVIEW_CONCURRENCY:
+            raise ValueError(f"concurrency must be between 1 and {MAX_REVIEW_CONCURRENCY}, got {concurrency}")
+        if tool_concurrency < 1:
+            raise ValueError(f"tool_concurrency must be at least 1, got {tool_concurrency}")
         self.langchain_tools = langchain_tools
         self.show_code_excerpts = show_code_excerpts
         self.context_lines_before = context_lines_before
@@ -51,3 +72,6 @@ class ReviewConfig:
         self.banned_severities = banned_severities
         self.allowed_categories = allowed_categories
         self.banned_categories = banned_categories
+        self.concurrency = concurrency
+        self.tool_concurrency = tool_concurrency
+        self.findings_cache = findings_cache
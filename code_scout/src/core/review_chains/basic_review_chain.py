@@ -1,18 +1,24 @@
 import json
 import re
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from langchain_core.language_models import BaseLanguageModel
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.messages.ai import UsageMetadata, add_usage
 from langchain_core.tools import BaseTool
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.prebuilt import create_react_agent  # pyright: ignore[reportUnknownVariableType]
 
+from cli.cli_config import cli_config
 from cli.cli_utils import echo_debug
 from core.models.code_diff import CodeDiff
+from core.models.diff_hunk import DiffHunk
 from core.models.review_config import ReviewConfig
 from core.models.review_finding import Category, ReviewFinding, Severity
 from core.models.review_result import ReviewResult
+from core.review_chains.hunk_findings_cache import HunkFindingsCache
 from core.utils.code_excerpt_extractor import CodeExcerptExtractor
 
 
@@ -37,17 +43,153 @@ class BasicReviewChain:
         llm: BaseLanguageModel[Any],
     ) -> ReviewResult:
         findings: list[ReviewFinding] = []
+        usage_metadata: UsageMetadata | None = None
         file_path_to_diff: dict[str, CodeDiff] = {diff.file_path: diff for diff in diffs}
 
-        response = self._invoke_llm(diffs, llm)
-        if response:
-            findings = self._process_llm_response(response, file_path_to_diff)
-        else:
-            findings.append(self._create_error_finding("LLM returned no content.", Severity.SUGGESTION))
+        findings_cache = self.config.findings_cache
+        cache_scope = self._get_cache_scope(llm) if findings_cache else ""
+        pending_diffs = diffs
+        if findings_cache:
+            replayed_findings, pending_diffs = self._replay_cached_hunks(
+                diffs, findings_cache, cache_scope, file_path_to_diff
+            )
+            findings.extend(replayed_findings)
+
+        for batch, response in self._invoke_llm_batches(pending_diffs, llm):
+            if response:
+                batch_findings = self._process_llm_response(response, file_path_to_diff)
+                findings.extend(batch_findings)
+                if findings_cache:
+                    self._store_hunk_findings(batch, batch_findings, findings_cache, cache_scope)
+                if response.usage_metadata:
+                    usage_metadata = add_usage(usage_metadata, response.usage_metadata)
+            else:
+                findings.append(self._create_error_finding("LLM returned no content.", Severity.SUGGESTION))
         return ReviewResult.aggregate(
             findings=findings,
-            usage_metadata=response.usage_metadata if response else None,
+            usage_metadata=usage_metadata,
+        )
+
+    def _invoke_llm_batches(
+        self, diffs: list[CodeDiff], llm: BaseLanguageModel[Any]
+    ) -> list[tuple[list[CodeDiff], AIMessage | None]]:
+        """
+        Reviews the diffs in up to `config.concurrency` batches of files, invoking the LLM for the
+        batches in parallel. With a concurrency of 1 all diffs go to the LLM in a single request.
+        Returns each batch with the LLM's response to it.
+        """
+        if not diffs:
+            return []
+        batch_count = self.config.concurrency
+        if batch_count <= 1 or len(diffs) <= 1:
+            return [(diffs, self._invoke_llm(diffs, llm))]
+
+        # Files are assigned to batches by a stable hash of their path rather than by position. After
+        # an edit, only batches containing changed files produce new prompts; the others repeat earlier
+        # requests exactly and are answered by the LLM response cache.
+        buckets: list[list[CodeDiff]] = [[] for _ in range(batch_count)]
+        for diff in diffs:
+            buckets[zlib.crc32(diff.file_path.encode()) % batch_count].append(diff)
+        batches = [bucket for bucket in buckets if bucket]
+        if len(batches) == 1:
+            return [(batches[0], self._invoke_llm(batches[0], llm))]
+
+        with ThreadPoolExecutor(max_workers=len(batches), thread_name_prefix="codescout-review") as executor:
+            return list(zip(batches, executor.map(lambda batch: self._invoke_llm(batch, llm), batches), strict=True))
+
+    def _get_cache_scope(self, llm: BaseLanguageModel[Any]) -> str:
+        """Identifies everything besides a hunk that shapes its findings: the model and the review instructions."""
+        llm_params = json.dumps(llm._identifying_params, sort_keys=True, default=str)  # pyright: ignore[reportPrivateUsage]
+        return f"{type(llm).__name__}\0{llm_params}\0{self._get_system_message()}"
+
+    def _replay_cached_hunks(
+        self,
+        diffs: list[CodeDiff],
+        findings_cache: HunkFindingsCache,
+        cache_scope: str,
+        file_path_to_diff: dict[str, CodeDiff],
+    ) -> tuple[list[ReviewFinding], list[CodeDiff]]:
+        """
+        Replays the findings of hunks that were reviewed before with the same model and instructions.
+        Returns those findings and the diffs that still need a review, reduced to their uncached hunks.
+        """
+        cached_findings = findings_cache.lookup_many(
+            findings_cache.make_key(cache_scope, diff.file_path, hunk) for diff in diffs for hunk in diff.hunks
         )
+        findings: list[ReviewFinding] = []
+        pending_diffs: list[CodeDiff] = []
+        for diff in diffs:
+            pending_hunks: list[DiffHunk] = []
+            for hunk in diff.hunks:
+                hunk_findings = cached_findings.get(findings_cache.make_key(cache_scope, diff.file_path, hunk))
+                if hunk_findings is None:
+                    pending_hunks.append(hunk)
+                    continue
+                # Line numbers are stored relative to the hunk, so findings follow a hunk that moved
+                findings_data = [
+                    {
+                        **finding_data,
+                        "file_path": diff.file_path,
+                        "line_number": hunk.target_start + finding_data.get("line_offset", 0),
+                    }
+                    for finding_data in hunk_findings
+                ]
+                findings.extend(self._create_findings_from_data(findings_data, file_path_to_diff))
+            # Diffs without hunks, such as renames, can't be cached and are always reviewed
+            if len(pending_hunks) == len(diff.hunks):
+                pending_diffs.append(diff)
+            elif pending_hunks:
+                pending_diffs.append(_with_hunks(diff, pending_hunks))
+        return findings, pending_diffs
+
+    def _store_hunk_findings(
+        self,
+        batch: list[CodeDiff],
+        batch_findings: list[ReviewFinding],
+        findings_cache: HunkFindingsCache,
+        cache_scope: str,
+    ) -> None:
+        """
+        Caches the findings of a reviewed batch per hunk, including hunks without findings. If any
+        finding can't be attributed to a single hunk of the batch, e.g. an error or a finding without a
+        line number, nothing is cached, as replaying the other hunks would lose that finding.
+        """
+        hunks: list[tuple[str, DiffHunk, str]] = []
+        findings_by_key: dict[str, list[dict[str, Any]]] = {}
+        for diff in batch:
+            for hunk in diff.hunks:
+                key = findings_cache.make_key(cache_scope, diff.file_path, hunk)
+                if key in findings_by_key:
+                    # Identical hunks in one file share a key, so their findings couldn't be told apart
+                    return
+                findings_by_key[key] = []
+                hunks.append((diff.file_path, hunk, key))
+
+        for finding in batch_findings:
+            line_number = finding.line_number
+            match = next(
+                (
+                    (hunk, key)
+                    for file_path, hunk, key in hunks
+                    if line_number
+                    and file_path == finding.file_path
+                    and hunk.target_start <= line_number < hunk.target_start + max(hunk.target_length, 1)
+                ),
+                None,
+            )
+            if line_number is None or match is None:
+                return
+            hunk, key = match
+            findings_by_key[key].append(
+                {
+                    "severity": finding.severity.value,
+                    "category": finding.category.value,
+                    "line_offset": line_number - hunk.target_start,
+                    "message": finding.message,
+                    "suggestion": finding.suggestion,
+                }
+            )
+        findings_cache.update_many(findings_by_key)
 
     def _invoke_llm(self, diffs: list[CodeDiff], llm: BaseLanguageModel[Any]) -> AIMessage | None:
         """Invoke the LLM with the structured code diffs using an agent executor."""
@@ -57,11 +199,14 @@ class BasicReviewChain:
 
         agent: CompiledStateGraph = create_react_agent(model=llm, tools=tools)  # pyright: ignore[reportMissingTypeArgument, reportUnknownVariableType]
 
-        echo_debug(f"Executing agent with tools: {[tool.name for tool in tools]}")
+        # Debug messages below can be large (full prompt, agent response), so they are only built in debug mode
+        if cli_config.is_debug:
+            echo_debug(f"Executing agent with tools: {[tool.name for tool in tools]}")
 
         diff_contents = f"{'\n'.join([d.llm_repr for d in diffs])}"
-        echo_debug(f"system message:\n{system_message_content}")
-        echo_debug("======================================")
+        if cli_config.is_debug:
+            echo_debug(f"system message:\n{system_message_content}")
+            echo_debug("======================================")
         # noinspection PyTypeChecker
         result: dict[str, Any] = agent.invoke(
             {
@@ -69,11 +214,15 @@ class BasicReviewChain:
                     SystemMessage(content=system_message_content),
                     HumanMessage(content=diff_contents),
                 ],
-            }
+            },
+            # The agent's tool node runs the tool calls of one LLM turn in parallel; this bounds how many
+            # run at once, so a turn requesting many files or searches doesn't open unbounded threads.
+            config={"max_concurrency": self.config.tool_concurrency},
         )
 
         last_response = self._extract_content_from_result(result)
-        echo_debug(f"Agent response: {last_response}")
+        if cli_config.is_debug:
+            echo_debug(f"Agent response: {last_response}")
         return last_response
 
     def _get_tools(self, diffs: list[CodeDiff]) -> list[BaseTool]:
@@ -87,7 +236,10 @@ class BasicReviewChain:
     def _extract_content_from_result(self, result: dict[str, Any]) -> AIMessage | None:
         result_messages: list[BaseMessage] | None = result.get("messages")
         # print only the type of message
-        echo_debug(f"Agent result messages: {[type(m).__name__ for m in result_messages] if result_messages else []}")
+        if cli_config.is_debug:
+            echo_debug(
+                f"Agent result messages: {[type(m).__name__ for m in result_messages] if result_messages else []}"
+            )
         if isinstance(result_messages, list) and result_messages:
             last_message = result_messages[-1]
             if isinstance(last_message, AIMessage):
@@ -270,3 +422,9 @@ Example response:
 ]
 ```
         """
+
+
+def _with_hunks(diff: CodeDiff, hunks: list[DiffHunk]) -> CodeDiff:
+    """Returns a copy of the diff that only presents the given hunks to the LLM."""
+    parsed_diff = diff.parsed_diff.model_copy(update={"hunks": hunks}) if diff.parsed_diff else None
+    return diff.model_copy(update={"hunks": hunks, "parsed_diff": parsed_diff})
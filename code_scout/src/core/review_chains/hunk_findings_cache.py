@@ -0,0 +1,97 @@
+"""SQLite-backed cache of review findings per diff hunk."""
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections.abc import Iterable
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+from core.llm_providers.llm_response_cache import DEFAULT_LLM_CACHE_TTL_SECONDS
+from core.models.diff_hunk import DiffHunk
+
+# Bump whenever the stored format or the meaning of cached findings changes, so old entries stop matching
+CACHE_VERSION = "1"
+
+DEFAULT_HUNK_FINDINGS_CACHE_PATH = "./.codescout/hunk_findings.db"
+
+# Keys looked up per query, well below SQLite's limit of bound parameters
+_LOOKUP_BATCH_SIZE = 500
+
+
+class HunkFindingsCache:
+    """
+    Persists the findings of reviewed diff hunks in a SQLite database, so re-reviewing a change only
+    sends the hunks that changed since, e.g. after amending a single file. Entries are keyed by a
+    SHA-256 of the review settings, the file path and the hunk's lines, wherever the hunk starts, and
+    expire after `ttl_seconds`. Findings are stored as plain dicts with their line number relative to
+    the start of the hunk, so they follow a hunk that moved.
+    """
+
+    db_path: str
+    ttl_seconds: int
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_HUNK_FINDINGS_CACHE_PATH,
+        ttl_seconds: int | None = None,
+    ):
+        self.db_path = db_path
+        self.ttl_seconds = DEFAULT_LLM_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._get_connection()) as conn, conn:
+            _ = conn.execute("""
+                CREATE TABLE IF NOT EXISTS hunk_findings (
+                    key TEXT PRIMARY KEY,
+                    findings TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # A connection per operation keeps the cache usable from parallel review threads
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    @staticmethod
+    def make_key(scope: str, file_path: str, hunk: DiffHunk) -> str:
+        """
+        Builds the key of a hunk. `scope` identifies everything else that shapes the findings, such as
+        the model and the review instructions. Line numbers are left out, so a moved hunk keeps its key.
+        """
+        hasher = hashlib.sha256(f"{CACHE_VERSION}\0{scope}\0{file_path}\0{hunk.heading}\0".encode())
+        for line in hunk.lines:
+            hasher.update(f"{line.line_type}\0{line.value}\0".encode())
+        return hasher.hexdigest()
+
+    def lookup_many(self, keys: Iterable[str]) -> dict[str, list[dict[str, Any]]]:
+        """Returns the cached findings of the keys that have a fresh entry."""
+        unique_keys = list(dict.fromkeys(keys))
+        found: dict[str, list[dict[str, Any]]] = {}
+        with closing(self._get_connection()) as conn:
+            for start in range(0, len(unique_keys), _LOOKUP_BATCH_SIZE):
+                batch = unique_keys[start : start + _LOOKUP_BATCH_SIZE]
+                rows = conn.execute(
+                    f"SELECT key, findings FROM hunk_findings WHERE created_at >= ? "
+                    f"AND key IN ({', '.join('?' * len(batch))})",
+                    (time.time() - self.ttl_seconds, *batch),
+                ).fetchall()
+                for key, findings in rows:
+                    try:
+                        found[key] = json.loads(findings)
+                    except ValueError:
+                        # Unreadable entries are treated as misses and overwritten by the next update
+                        continue
+        return found
+
+    def update_many(self, findings_by_key: dict[str, list[dict[str, Any]]]) -> None:
+        """Stores the findings of several hunks; hunks without findings are stored with an empty list."""
+        if not findings_by_key:
+            return
+        now = time.time()
+        with closing(self._get_connection()) as conn, conn:
+            _ = conn.executemany(
+                "INSERT OR REPLACE INTO hunk_findings (key, findings, created_at) VALUES (?, ?, ?)",
+                [(key, json.dumps(findings), now) for key, findings in findings_by_key.items()],
+            )
@@ -3,6 +3,8 @@ from typing import Any
 
 from langchain_core.language_models import BaseLanguageModel
 
+from cli.cli_utils import echo_error, echo_info, show_spinner
+from cli.code_scout_context import CodeScoutContext
 from core.interfaces.diff_provider import DiffProvider
 from core.interfaces.llm_provider import LLMProvider
 from core.interfaces.review_formatter import ReviewFormatter
@@ -13,8 +15,6 @@ from core.models.review_result import ReviewResult
 from core.review_chains.basic_review_chain import BasicReviewChain
 from core.tools.file_content_tool import FileContentTool
 from core.tools.search_code_index_tool import SearchCodeIndexTool
-from src.cli.cli_utils import echo_error, echo_info, show_spinner
-from src.cli.code_scout_context import CodeScoutContext
 
 
 class CodeReviewAgent:
@@ -106,8 +106,7 @@ class CodeReviewAgent:
         """Format and output the review results."""
         found_formatter = False
         for formatter in self.formatters:
-            output = formatter.format(result)
-            echo_info(output)
+            formatter.write(result)
             found_formatter = True
             break
         if not found_formatter:
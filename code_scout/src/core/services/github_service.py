@@ -1,3 +1,6 @@
+import threading
+import time
+
 from github import Github, GithubException
 from github.File import File
 from github.GithubException import UnknownObjectException
@@ -10,6 +13,11 @@ from cli.cli_utils import echo_warning
 HTTP_NOT_FOUND = 404
 HTTP_FORBIDDEN = 403
 
+# How long a fetched page of open pull requests is reused before GitHub is asked again
+OPEN_PULL_REQUESTS_TTL_SECONDS = 60
+# Most pages of open pull requests kept per service; the oldest page is dropped first
+OPEN_PULL_REQUESTS_CACHE_SIZE = 64
+
 
 class GitHubService:
     """
@@ -38,6 +46,10 @@ class GitHubService:
         self.repo_owner = repo_owner
         self.repo_name = repo_name
         self.repo = self._get_repository()
+        # Pages of open pull requests by page number, with the time they were fetched. Kept per instance, as
+        # the pull requests are bound to this service's client and token.
+        self._open_pull_requests_cache: dict[int, tuple[float, list[PullRequest]]] = {}
+        self._open_pull_requests_lock = threading.Lock()
 
     def _get_repository(self) -> Repository:
         """
@@ -87,10 +99,10 @@ class GitHubService:
     ) -> list[PullRequest]:
         """
         Retrieves open pull requests for the encapsulated repository with pagination.
+        Pages are cached for OPEN_PULL_REQUESTS_TTL_SECONDS.
 
         Args:
             page: The page number to retrieve (0-indexed).
-            per_page: The number of pull requests per page.
 
         Returns:
             A list of PyGithub PullRequest objects.
@@ -98,17 +110,36 @@ class GitHubService:
         Raises:
             ValueError: If an API error occurs.
         """
+        with self._open_pull_requests_lock:
+            cached = self._open_pull_requests_cache.get(page)
+        if cached and time.monotonic() - cached[0] < OPEN_PULL_REQUESTS_TTL_SECONDS:
+            return list(cached[1])
+
         try:
             # PyGithub's get_pulls method supports pagination directly
             # The page parameter is 0-indexed for PyGithub's get_page method
             pulls = self.repo.get_pulls(state="open")
-            paginated_pulls = pulls.get_page(page)
-            return list(paginated_pulls)
+            paginated_pulls = list(pulls.get_page(page))
         except GithubException as e:
             raise ValueError(f"GitHub API error: {e.status} - {e.data}") from e
         except Exception as e:
             raise ValueError(f"An unexpected error occurred while listing pull requests: {e}") from e
 
+        with self._open_pull_requests_lock:
+            # Re-inserted, so a refreshed page moves to the end of the eviction order
+            _ = self._open_pull_requests_cache.pop(page, None)
+            self._open_pull_requests_cache[page] = (time.monotonic(), paginated_pulls)
+            if len(self._open_pull_requests_cache) > OPEN_PULL_REQUESTS_CACHE_SIZE:
+                del self._open_pull_requests_cache[next(iter(self._open_pull_requests_cache))]
+        return list(paginated_pulls)
+
+    def clear_open_pull_requests_cache(self) -> None:
+        """
+        Drops all cached pages of open pull requests, so the next lookups go to GitHub.
+        """
+        with self._open_pull_requests_lock:
+            self._open_pull_requests_cache.clear()
+
     def get_pull_request_files(self, pull: PullRequest) -> PaginatedList[File]:
         """
         Retrieves the files changed in a pull request.
@@ -15,10 +15,10 @@ class FileContentTool(LangChainReviewTool):
     @override
     def get_tool(self, diffs: list[CodeDiff]) -> BaseTool | None:
         """Create file content access tool configured for the given diffs."""
-        # Build file content map from diffs
-        self.file_content_map = {
-            diff.file_path: diff.current_file_content for diff in diffs if diff.current_file_content
-        }
+        # Build file content map from diffs. The tool reads its own map rather than the attribute, so
+        # tools built for different batches of diffs can run side by side.
+        file_content_map = {diff.file_path: diff.current_file_content for diff in diffs if diff.current_file_content}
+        self.file_content_map = file_content_map
 
         @tool("get_full_file_content")
         def get_full_file_content(
@@ -39,11 +39,11 @@ class FileContentTool(LangChainReviewTool):
             - Focus on files where the diff doesn\'t provide enough information for thorough review
             ', additional_kwargs={}, response_metadata={}, id='87f95f24-ecec-4031-8076-3d4e553badc0'),
             """
-            if file_path not in self.file_content_map:
-                available_files = list(self.file_content_map.keys())
+            if file_path not in file_content_map:
+                available_files = list(file_content_map.keys())
                 return f"File '{file_path}' not available. Available files: {available_files}"
 
-            content = self.file_content_map[file_path]
+            content = file_content_map[file_path]
             if not content:
                 return f"File '{file_path}' has no content available."
 
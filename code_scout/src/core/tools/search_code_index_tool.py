@@ -47,6 +47,10 @@ class SearchCodeIndexTool(LangChainReviewTool):
         # Extract file paths from diffs for relevance boosting
         diff_file_paths = [diff.file_path for diff in diffs if diff.file_path]
 
+        # The agent often repeats a search while working through a review; the index does not change
+        # during a review, so formatted results are reused for identical searches.
+        search_results: dict[tuple[str, str | None, str | None, int], str] = {}
+
         @tool("search_code_index")
         def search_code_index(
             query: Annotated[str, "Search query for finding code symbols (functions, classes, methods, etc.)"],
@@ -72,6 +76,11 @@ class SearchCodeIndexTool(LangChainReviewTool):
             - Use file_pattern to narrow search to specific directories or file types
             - Results are ranked by relevance, with files from the current diff boosted
             """
+            cache_key = (query, symbol_type, file_pattern, limit)
+            cached_result = search_results.get(cache_key)
+            if cached_result is not None:
+                return cached_result
+
             try:
                 # Create search query with boost paths from current diffs
                 search_query = CodeIndexQuery(
@@ -86,7 +95,9 @@ class SearchCodeIndexTool(LangChainReviewTool):
                 results = manager.search_symbols(search_query)
 
                 # Format results for LLM consumption
-                return self._format_search_results(results)
+                formatted_results = self._format_search_results(results)
+                search_results[cache_key] = formatted_results
+                return formatted_results
 
             except Exception as e:
                 return f"Error searching code index: {e!s}"
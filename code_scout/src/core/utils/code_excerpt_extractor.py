@@ -1,5 +1,10 @@
 from dataclasses import dataclass
 
+# Like git, only the start of a file is inspected to tell binary from text content
+BINARY_PROBE_LENGTH = 8000
+# A UTF-8 encoded character takes at most this many bytes
+_MAX_UTF8_CHAR_BYTES = 4
+
 
 @dataclass
 class CodeExcerpt:
@@ -95,7 +100,7 @@ class CodeExcerptExtractor:
     def is_binary_content(content: str) -> bool:
         """
         Check if content appears to be binary (contains null bytes or high
-        ratio of non-printable chars).
+        ratio of non-printable chars in its first BINARY_PROBE_LENGTH chars).
 
         Args:
             content: File content to check
@@ -111,9 +116,10 @@ class CodeExcerptExtractor:
             return True
 
         # Check ratio of printable characters
-        if len(content) > 0:
-            printable_chars = sum(1 for c in content if c.isprintable() or c in "\n\r\t")
-            ratio = printable_chars / len(content)
+        sample = content[:BINARY_PROBE_LENGTH]
+        if len(sample) > 0:
+            printable_chars = sum(1 for c in sample if c.isprintable() or c in "\n\r\t")
+            ratio = printable_chars / len(sample)
             min_printable_ratio = 0.7
             return ratio < min_printable_ratio  # If less than 70% printable, consider binary
 
@@ -134,6 +140,14 @@ class CodeExcerptExtractor:
         if not content:
             return False
 
+        max_size_bytes = max_size_kb * 1024
+        # The encoded size is between len(content) and 4 * len(content) bytes, so most files are decided
+        # without encoding them
+        if len(content) > max_size_bytes:
+            return True
+        if len(content) * _MAX_UTF8_CHAR_BYTES <= max_size_bytes:
+            return False
+
         size_bytes = len(content.encode("utf-8"))
         size_kb = size_bytes / 1024
         return size_kb > max_size_kb
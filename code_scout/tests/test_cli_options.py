@@ -1,5 +1,6 @@
 import os
 from collections.abc import Generator
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -7,7 +8,15 @@ import typer
 from click.testing import Result
 from typer.testing import CliRunner
 
-from cli.cli_options import code_paths_option, file_extensions_option
+from cli import entry_point
+from cli.cli_options import (
+    code_paths_option,
+    env_file_option,
+    file_extensions_option,
+    pr_number_option,
+    repo_name_option,
+    version_option,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -222,3 +231,147 @@ def test_cli_option_precedence_cli_over_env() -> None:
     _assert_success(result)
     assert "Code Paths: cli/path1" in result.stdout
     assert "File Extensions: cli_ext1" in result.stdout
+
+
+def test_env_file_option_overrides_env_values(tmp_path: Path) -> None:
+    """Test that values loaded from --env-file are seen by options and do not leak into later runs."""
+    env_file = tmp_path / "test.env"
+    _ = env_file.write_text("CODESCOUT_INDEX_CODE_PATHS=file/path1,file/path2\n")
+    app = typer.Typer()
+
+    @app.command("test")
+    def test_command(  # pyright: ignore[reportUnusedFunction]
+        _env_file: str | None = env_file_option(),
+        code_paths: list[str] = code_paths_option(),  # noqa B008
+    ) -> None:
+        typer.echo(f"Code Paths: {','.join(code_paths)}")
+
+    runner = CliRunner()
+    env = {"CODESCOUT_INDEX_CODE_PATHS": "env/path1"}
+    result = runner.invoke(app, ["--env-file", str(env_file)], env=env)
+    _assert_success(result)
+    assert "Code Paths: file/path1,file/path2" in result.stdout
+
+    result = runner.invoke(app, [], env=env)
+    _assert_success(result)
+    assert "Code Paths: env/path1" in result.stdout
+
+
+def test_pr_number_option_from_env_is_int() -> None:
+    """Test that pr_number_option converts the environment variable value to int."""
+    app = typer.Typer()
+
+    @app.command("test")
+    def test_command(  # pyright: ignore[reportUnusedFunction]
+        pr_number: int = pr_number_option(),
+    ) -> None:
+        typer.echo(f"PR: {pr_number!r} {type(pr_number).__name__}")
+
+    runner = CliRunner()
+    result = runner.invoke(app, [], env={"CODESCOUT_PR_NUMBER": "42"})
+    _assert_success(result)
+    assert "PR: 42 int" in result.stdout
+
+    result = runner.invoke(app, [], env={"CODESCOUT_PR_NUMBER": "abc"})
+    assert result.exit_code == 2
+    assert "'abc' is not a valid integer." in result.stderr
+
+
+def test_explicit_zero_wins_over_env() -> None:
+    """Test that an explicit falsy value such as 0 is used instead of the environment variable."""
+    app = typer.Typer()
+
+    @app.command("test")
+    def test_command(  # pyright: ignore[reportUnusedFunction]
+        pr_number: int = pr_number_option(),
+    ) -> None:
+        typer.echo(f"PR: {pr_number!r}")
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["--pr-number", "0"], env={"CODESCOUT_PR_NUMBER": "42"})
+    _assert_success(result)
+    assert "PR: 0" in result.stdout
+
+
+def test_explicit_empty_string_counts_as_missing() -> None:
+    """Test that an empty option value falls back to the environment variable, or fails when it is required."""
+    app = typer.Typer()
+
+    @app.command("test")
+    def test_command(  # pyright: ignore[reportUnusedFunction]
+        repo_name: str = repo_name_option(),
+    ) -> None:
+        typer.echo(f"Repo: {repo_name!r}")
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["--repo-name", ""], env={"CODESCOUT_REPO_NAME": "env-repo"})
+    _assert_success(result)
+    assert "Repo: 'env-repo'" in result.stdout
+
+    result = runner.invoke(app, ["--repo-name", ""], env={"CODESCOUT_REPO_NAME": None, "CODESCOUT_NONINTERACTIVE": "1"})
+    assert result.exit_code == 1
+
+
+def test_required_option_does_not_prompt_when_noninteractive() -> None:
+    """Test that a missing required option fails instead of prompting when CODESCOUT_NONINTERACTIVE is set."""
+    app = typer.Typer()
+
+    @app.command("test")
+    def test_command(  # pyright: ignore[reportUnusedFunction]
+        pr_number: int = pr_number_option(),
+    ) -> None:
+        typer.echo(f"PR: {pr_number}")
+
+    runner = CliRunner()
+    result = runner.invoke(app, [], input="42\n", env={"CODESCOUT_NONINTERACTIVE": "1"})
+    assert result.exit_code == 1
+    assert "Enter Pull Request number" not in result.stdout
+    assert "PR: 42" not in result.stdout
+
+
+def test_required_option_does_not_prompt_on_ci() -> None:
+    """Test that prompting is skipped on CI, unless CODESCOUT_NONINTERACTIVE explicitly allows it."""
+    app = typer.Typer()
+
+    @app.command("test")
+    def test_command(  # pyright: ignore[reportUnusedFunction]
+        pr_number: int = pr_number_option(),
+    ) -> None:
+        typer.echo(f"PR: {pr_number}")
+
+    runner = CliRunner()
+    result = runner.invoke(app, [], input="42\n", env={"CI": "true", "CODESCOUT_NONINTERACTIVE": None})
+    assert result.exit_code == 1
+    assert "Enter Pull Request number" not in result.stdout
+
+    result = runner.invoke(app, [], input="42\n", env={"CI": "true", "CODESCOUT_NONINTERACTIVE": "0"})
+    assert result.exit_code == 0
+    assert "PR: 42" in result.stdout
+
+
+def test_version_option_exits_before_other_options() -> None:
+    """Test that --version prints the version without resolving or prompting for other options."""
+    app = typer.Typer()
+
+    @app.command("test")
+    def test_command(  # pyright: ignore[reportUnusedFunction]
+        pr_number: int = pr_number_option(),
+        _version: bool = version_option(),
+    ) -> None:
+        typer.echo(f"PR: {pr_number}")
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["--version"], env={"CODESCOUT_NONINTERACTIVE": "1"})
+    _assert_success(result)
+    assert result.stdout.strip() == entry_point.get_version()
+
+
+def test_entry_point_answers_version_without_the_app(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that a bare --version is answered by the console script itself."""
+    monkeypatch.setattr("sys.argv", ["codescout", "--version"])
+
+    entry_point.main()
+
+    assert capsys.readouterr().out.strip() == entry_point.get_version()
@@ -1,4 +1,4 @@
-from core.utils.code_excerpt_extractor import CodeExcerptExtractor
+from core.utils.code_excerpt_extractor import BINARY_PROBE_LENGTH, CodeExcerptExtractor
 
 
 class TestCodeExcerptExtractor:
@@ -126,6 +126,10 @@ line 3"""
         non_printable = "".join([chr(i) for i in range(0, 32)] * 10)
         assert CodeExcerptExtractor.is_binary_content(non_printable)
 
+        # Only the start of the content decides the printable ratio
+        text_then_control_chars = "x" * BINARY_PROBE_LENGTH + "\x01" * BINARY_PROBE_LENGTH
+        assert not CodeExcerptExtractor.is_binary_content(text_then_control_chars)
+
     def test_is_file_too_large(self) -> None:
         """Test file size checking."""
         small_content = "Hello, World!"
@@ -137,3 +141,7 @@ line 3"""
 
         # Empty content
         assert not CodeExcerptExtractor.is_file_too_large("", max_size_kb=1)
+
+        # Multi-byte characters count with their encoded size
+        assert CodeExcerptExtractor.is_file_too_large("é" * 600, max_size_kb=1)
+        assert not CodeExcerptExtractor.is_file_too_large("é" * 500, max_size_kb=1)
@@ -0,0 +1,14 @@
+from core.code_index.code_index_extractor import CodeIndexExtractor
+
+
+def test_query_is_compiled_once_per_language() -> None:
+    """Test that files of the same language reuse the compiled query and still get their own symbols."""
+    extractor = CodeIndexExtractor()
+
+    first = extractor.extract_symbols("a.py", "def first():\n    pass\n")
+    query = extractor.queries["python"]
+    second = extractor.extract_symbols("b.py", "class Second:\n    pass\n")
+
+    assert [(symbol.name, symbol.file_path) for symbol in first] == [("first", "a.py")]
+    assert [(symbol.name, symbol.file_path) for symbol in second] == [("Second", "b.py")]
+    assert extractor.queries["python"] is query
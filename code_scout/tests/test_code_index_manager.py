@@ -0,0 +1,85 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from core.code_index import code_index_manager
+from core.code_index.code_index_config import CodeIndexConfig
+from core.code_index.code_index_manager import CodeIndexManager
+from core.code_index.models import CodeSymbol
+
+
+def _write_sources(code_path: Path, count: int) -> None:
+    code_path.mkdir()
+    for i in range(count):
+        _ = (code_path / f"module_{i}.py").write_text(
+            f"def function_{i}(value):\n    return value\n\n\nclass Class{i}:\n    pass\n"
+        )
+
+
+def test_parallel_build_matches_serial_build(tmp_path: Path) -> None:
+    """Test that parsing files in worker processes indexes the same symbols as parsing them in-process."""
+    code_path = tmp_path / "src"
+    _write_sources(code_path, 40)
+    serial = CodeIndexManager(CodeIndexConfig(db_path=str(tmp_path / "serial.db")))
+    parallel = CodeIndexManager(CodeIndexConfig(db_path=str(tmp_path / "parallel.db")))
+
+    serial_result = serial.build_index([str(code_path)], print_file_paths=False)
+    parallel_result = parallel.build_index([str(code_path)], print_file_paths=False, workers=2)
+
+    assert serial_result.success
+    assert parallel_result.success
+    assert parallel_result.files_processed == serial_result.files_processed == 40
+    assert parallel_result.symbols_indexed == serial_result.symbols_indexed
+    assert parallel.get_index_stats().total_files == 40
+
+
+def test_scan_filters_files_by_extension(tmp_path: Path) -> None:
+    """Test that only files with a configured extension are scanned, ignoring case and dot-only names."""
+    code_path = tmp_path / "src"
+    _write_sources(code_path, 2)
+    for name in ("UPPER.PY", "notes.md", ".py", "py", "archive.py.txt"):
+        _ = (code_path / name).write_text("x = 1\n")
+    manager = CodeIndexManager(CodeIndexConfig(db_path=str(tmp_path / "index.db"), file_extensions=[".py"]))
+
+    scanned = manager._scan_files(str(code_path), None)  # pyright: ignore[reportPrivateUsage]
+
+    assert sorted(Path(path).name for path in scanned) == ["UPPER.PY", "module_0.py", "module_1.py"]
+
+
+def test_build_writes_files_in_chunks_and_keeps_files_around_a_failing_one(tmp_path: Path) -> None:
+    """Test that symbols are written in bounded chunks, and a file that can't be written only loses itself."""
+    code_path = tmp_path / "src"
+    _write_sources(code_path, 10)
+    manager = CodeIndexManager(CodeIndexConfig(db_path=str(tmp_path / "index.db")))
+    insert_indexed_files = manager.repository.insert_indexed_files
+    chunk_sizes: list[int] = []
+
+    def failing_insert(indexed_files: list[tuple[str, str, list[CodeSymbol]]]) -> None:
+        chunk_sizes.append(len(indexed_files))
+        if any(file_path == "module_3.py" for file_path, _, _ in indexed_files):
+            raise ValueError("bad row")
+        insert_indexed_files(indexed_files)
+
+    with (
+        patch.object(code_index_manager, "_INSERT_CHUNK_FILES", 4),
+        patch.object(manager.repository, "insert_indexed_files", failing_insert),
+    ):
+        result = manager.build_index([str(code_path)], print_file_paths=False)
+
+    assert max(chunk_sizes) == 4
+    assert not result.success
+    assert result.errors == [f"Error processing file {(code_path / 'module_3.py').as_posix()}: bad row"]
+    assert result.symbols_indexed == 9 * 2
+    assert manager.get_index_stats().total_files == 9
+
+
+def test_build_restores_the_previous_synchronous_setting(tmp_path: Path) -> None:
+    """Test that skipping fsyncs is scoped to the build, leaving the reused connection as it was."""
+    code_path = tmp_path / "src"
+    _write_sources(code_path, 2)
+    manager = CodeIndexManager(CodeIndexConfig(db_path=str(tmp_path / "index.db")))
+    connection = manager.repository._get_connection()  # pyright: ignore[reportPrivateUsage]
+    _ = connection.execute("PRAGMA synchronous=FULL")
+
+    _ = manager.build_index([str(code_path)], print_file_paths=False)
+
+    assert connection.execute("PRAGMA synchronous").fetchone()[0] == 2
@@ -0,0 +1,100 @@
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from core.code_index.code_index_repository import CodeIndexRepository
+from core.code_index.models import CodeSymbol
+
+
+def test_connection_is_reused_within_a_thread(tmp_path: Path) -> None:
+    """Test that operations on one thread share a connection, and other threads get their own."""
+    repository = CodeIndexRepository(str(tmp_path / "code_index.db"))
+    other_thread_connections = []
+    thread = threading.Thread(target=lambda: other_thread_connections.append(repository._get_connection()))  # pyright: ignore[reportPrivateUsage]
+    thread.start()
+    thread.join()
+
+    assert repository._get_connection() is repository._get_connection()  # pyright: ignore[reportPrivateUsage]
+    assert other_thread_connections[0] is not repository._get_connection()  # pyright: ignore[reportPrivateUsage]
+
+
+def test_repository_is_usable_after_close(tmp_path: Path) -> None:
+    """Test that closing the repository releases its connection and later operations reconnect."""
+    repository = CodeIndexRepository(str(tmp_path / "code_index.db"))
+    connection = repository._get_connection()  # pyright: ignore[reportPrivateUsage]
+
+    repository.close()
+
+    assert repository._get_connection() is not connection  # pyright: ignore[reportPrivateUsage]
+    assert repository.get_distinct_symbol_types() == []
+
+
+def test_close_releases_connections_of_other_threads(tmp_path: Path) -> None:
+    """Test that close() on one thread also closes connections another thread opened, e.g. a tool thread."""
+    repository = CodeIndexRepository(str(tmp_path / "code_index.db"))
+    other_thread_connections = []
+    thread = threading.Thread(target=lambda: other_thread_connections.append(repository._get_connection()))  # pyright: ignore[reportPrivateUsage]
+    thread.start()
+    thread.join()
+
+    repository.close()
+
+    with pytest.raises(sqlite3.ProgrammingError, match="closed"):
+        _ = other_thread_connections[0].execute("SELECT 1")
+    assert repository.get_distinct_symbol_types() == []
+
+
+def test_insert_indexed_files_writes_symbols_and_tracking(tmp_path: Path) -> None:
+    """Test that symbols and file tracking rows of many files are written together."""
+    repository = CodeIndexRepository(str(tmp_path / "code_index.db"))
+    symbol = CodeSymbol(
+        name="foo", symbol_type="function", file_path="a.py", start_line_number=1, language="python", file_hash="h1"
+    )
+
+    repository.insert_indexed_files([("a.py", "h1", [symbol]), ("b.py", "h2", [])])
+
+    assert repository.get_index_stats().total_symbols == 1
+    assert repository.get_file_hash("a.py") == "h1"
+    assert repository.get_file_hash("b.py") == "h2"
+
+
+def test_search_file_pattern_supports_globs_and_substrings(tmp_path: Path) -> None:
+    """Test that file patterns with wildcards are matched as globs, and other patterns as substrings."""
+    repository = CodeIndexRepository(str(tmp_path / "code_index.db"))
+    symbols = [
+        CodeSymbol(
+            name="load", symbol_type="function", file_path=path, start_line_number=1, language=language, file_hash="h"
+        )
+        for path, language in (("src/loader.py", "python"), ("web/loader.ts", "typescript"))
+    ]
+    repository.insert_symbols(symbols)
+
+    def search(file_pattern: str) -> list[str]:
+        return [symbol.file_path for symbol in repository.search_fts("load", {"file_pattern": file_pattern})]
+
+    assert search("*.py") == ["src/loader.py"]
+    assert search("web/*") == ["web/loader.ts"]
+    assert sorted(search("loader")) == ["src/loader.py", "web/loader.ts"]
+
+
+def test_search_file_pattern_ignores_case_and_keeps_brackets_literal(tmp_path: Path) -> None:
+    """Test that globs ignore case, and that brackets in paths match literally with and without wildcards."""
+    repository = CodeIndexRepository(str(tmp_path / "code_index.db"))
+    symbols = [
+        CodeSymbol(
+            name="load", symbol_type="function", file_path=path, start_line_number=1, language=language, file_hash="h"
+        )
+        for path, language in (("src/loader.py", "python"), ("app/[id]/page.tsx", "typescript"))
+    ]
+    repository.insert_symbols(symbols)
+
+    def search(file_pattern: str) -> list[str]:
+        return [symbol.file_path for symbol in repository.search_fts("load", {"file_pattern": file_pattern})]
+
+    assert search("*.PY") == ["src/loader.py"]
+    assert search("SRC/*") == ["src/loader.py"]
+    assert search("app/[id]/page.tsx") == ["app/[id]/page.tsx"]
+    assert search("app/[id]/*.tsx") == ["app/[id]/page.tsx"]
+    assert search("app/[i]/*") == []
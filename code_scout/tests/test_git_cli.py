@@ -0,0 +1,58 @@
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from cli.code_scout_context import CodeScoutContext
+from cli.git_cli import git_app
+
+
+@pytest.fixture
+def review_mocks() -> Generator[dict[str, MagicMock], Any, None]:
+    """Replaces everything the review command builds, so only the CLI-to-pipeline wiring runs."""
+    with (
+        patch("core.diff_providers.git_diff_provider.GitDiffProvider"),
+        patch("core.tools.search_code_index_tool.SearchCodeIndexTool"),
+        patch("core.services.code_review_agent.CodeReviewAgent") as agent,
+        patch("core.llm_providers.cached_langchain_provider.CachedLangChainProvider") as cached_provider,
+        patch("core.review_chains.hunk_findings_cache.HunkFindingsCache") as findings_cache,
+    ):
+        yield {"agent": agent, "cached_provider": cached_provider, "findings_cache": findings_cache}
+
+
+def _invoke_review(args: list[str], env: dict[str, str]) -> Any:
+    runner = CliRunner()
+    return runner.invoke(
+        # With a single command, Typer runs it directly instead of as a "review" subcommand
+        git_app,
+        args,
+        obj=CodeScoutContext(model="test-model", openrouter_api_key=None, openai_api_key=None, claude_api_key=None),
+        env={"CODESCOUT_NONINTERACTIVE": "1", **env},
+    )
+
+
+def test_cache_ttl_zero_is_passed_to_the_cache(review_mocks: dict[str, MagicMock]) -> None:
+    """Test that --cache-ttl 0 disables reuse of cached responses instead of falling back to a default."""
+    result = _invoke_review(["--cache-ttl", "0"], env={"CODESCOUT_CACHE_TTL": "99"})
+
+    assert result.exit_code == 0, result.stdout
+    review_mocks["cached_provider"].assert_called_once_with(ttl_seconds=0)
+    review_mocks["findings_cache"].assert_called_once_with(ttl_seconds=0)
+
+
+def test_concurrency_zero_is_rejected(review_mocks: dict[str, MagicMock]) -> None:
+    """Test that --concurrency 0 reaches the review config validation instead of becoming 1."""
+    result = _invoke_review(["--concurrency", "0"], env={})
+
+    assert result.exit_code == 1
+    review_mocks["agent"].assert_not_called()
+
+
+def test_tool_concurrency_zero_is_rejected(review_mocks: dict[str, MagicMock]) -> None:
+    """Test that --tool-concurrency 0 reaches the review config validation instead of becoming the default."""
+    result = _invoke_review(["--tool-concurrency", "0"], env={})
+
+    assert result.exit_code == 1
+    review_mocks["agent"].assert_not_called()
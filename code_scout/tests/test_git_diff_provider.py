@@ -302,3 +302,18 @@ class TestGitDiffProvider:
         assert len(diffs) == 1
         code_diff = diffs[0]
         assert code_diff.current_file_content is None  # Large files should have None content
+
+    def test_get_diff_is_collected_once(self) -> None:
+        with patch("git.Repo") as mock_repo_class:
+            mock_repo = MagicMock(spec=Repo)
+            mock_repo_class.return_value = mock_repo
+            mock_repo.remotes = []
+            mock_repo.index.diff.return_value = []
+
+            provider = GitDiffProvider(repo_path=self.REPO_PATH, staged=True)
+            first = provider.get_diff()
+            second = provider.get_diff()
+
+        assert first == second == []
+        mock_repo_class.assert_called_once_with(path=self.REPO_PATH)
+        mock_repo.index.diff.assert_called_once()
@@ -201,3 +201,36 @@ class TestGitHubDiffProvider:
 
         assert len(diffs) == 0
         mock_parse_github_file.assert_called_once()
+
+    def test_init_reuses_given_github_service(self) -> None:
+        github_service = MagicMock(spec=GitHubService)
+
+        with patch("core.diff_providers.github_diff_provider.GitHubService") as mock_service_class:
+            provider = GitHubDiffProvider(
+                self.OWNER, self.REPO, self.PR_NUMBER, self.TOKEN, github_service=github_service
+            )
+
+        assert provider.github_service is github_service
+        mock_service_class.assert_not_called()
+
+    def test_get_diff_uses_prefetched_result(self) -> None:
+        github_service = MagicMock(spec=GitHubService)
+        github_service.get_pull_request_files.return_value = []
+
+        provider = GitHubDiffProvider(self.OWNER, self.REPO, self.PR_NUMBER, self.TOKEN, github_service=github_service)
+        provider.prefetch()
+        provider.prefetch()
+
+        assert provider.get_diff() == []
+        assert provider.get_diff() == []
+        github_service.get_pull_request.assert_called_once_with(self.PR_NUMBER)
+
+    def test_get_diff_raises_prefetch_error(self) -> None:
+        github_service = MagicMock(spec=GitHubService)
+        github_service.get_pull_request.side_effect = ValueError("Pull request #123 not found")
+
+        provider = GitHubDiffProvider(self.OWNER, self.REPO, self.PR_NUMBER, self.TOKEN, github_service=github_service)
+        provider.prefetch()
+
+        with pytest.raises(ValueError, match="not found"):
+            _ = provider.get_diff()
@@ -0,0 +1,65 @@
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from github.PullRequest import PullRequest
+
+from core.services import github_service
+from core.services.github_service import GitHubService
+
+
+@pytest.fixture
+def service() -> Generator[GitHubService, Any, Any]:
+    with patch("core.services.github_service.Github"):
+        yield GitHubService("token", "owner", "repo")
+
+
+def test_open_pull_requests_page_is_cached(service: GitHubService) -> None:
+    """Test that a page of open pull requests is fetched from GitHub only once within the TTL."""
+    pull_request = MagicMock(spec=PullRequest)
+    service.repo.get_pulls.return_value.get_page.return_value = [pull_request]  # pyright: ignore[reportAttributeAccessIssue]
+
+    assert service.get_open_pull_requests(page=0) == [pull_request]
+    assert service.get_open_pull_requests(page=0) == [pull_request]
+
+    service.repo.get_pulls.return_value.get_page.assert_called_once_with(0)  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def test_open_pull_requests_pages_are_cached_separately(service: GitHubService) -> None:
+    """Test that each page has its own cache entry."""
+    _ = service.get_open_pull_requests(page=0)
+    _ = service.get_open_pull_requests(page=1)
+
+    assert service.repo.get_pulls.return_value.get_page.call_count == 2  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def test_open_pull_requests_cache_expires(service: GitHubService) -> None:
+    """Test that pages older than the TTL are fetched again."""
+    with patch.object(github_service, "OPEN_PULL_REQUESTS_TTL_SECONDS", 0):
+        _ = service.get_open_pull_requests(page=0)
+        _ = service.get_open_pull_requests(page=0)
+
+    assert service.repo.get_pulls.return_value.get_page.call_count == 2  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def test_open_pull_requests_cache_is_not_shared_between_services(service: GitHubService) -> None:
+    """Test that a service, e.g. one with another token, never gets pull requests fetched by another service."""
+    _ = service.get_open_pull_requests(page=0)
+    with patch("core.services.github_service.Github"):
+        other_service = GitHubService("other-token", "owner", "repo")
+
+    _ = other_service.get_open_pull_requests(page=0)
+
+    other_service.repo.get_pulls.return_value.get_page.assert_called_once_with(0)  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def test_open_pull_requests_cache_is_bounded(service: GitHubService) -> None:
+    """Test that only the most recent pages are kept, dropping the oldest first."""
+    with patch.object(github_service, "OPEN_PULL_REQUESTS_CACHE_SIZE", 2):
+        for page in range(3):
+            _ = service.get_open_pull_requests(page=page)
+        _ = service.get_open_pull_requests(page=2)
+        _ = service.get_open_pull_requests(page=0)
+
+    assert service.repo.get_pulls.return_value.get_page.call_count == 4  # pyright: ignore[reportAttributeAccessIssue]
@@ -0,0 +1,118 @@
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, Generation
+
+from core.llm_providers.llm_response_cache import LLMResponseCache
+
+
+def _response(content: str) -> list[ChatGeneration]:
+    return [
+        ChatGeneration(
+            message=AIMessage(
+                content=content,
+                tool_calls=[{"name": "get_full_file_content", "args": {"file_path": "a.py"}, "id": "call_1"}],
+            )
+        )
+    ]
+
+
+def test_cached_response_is_returned_for_same_prompt_and_model(tmp_path: Path) -> None:
+    """Test that a stored response, including tool calls, is returned for the same prompt and model."""
+    cache = LLMResponseCache(db_path=str(tmp_path / "llm_cache.db"))
+    cache.update("prompt", "model-a", _response("[]"))
+
+    cached = cache.lookup("prompt", "model-a")
+
+    assert cached is not None
+    assert len(cached) == 1
+    message = cached[0].message  # pyright: ignore[reportAttributeAccessIssue]
+    assert isinstance(message, AIMessage)
+    assert message.content == "[]"
+    assert message.tool_calls[0]["args"] == {"file_path": "a.py"}
+
+
+def test_cache_misses_for_other_prompt_or_model(tmp_path: Path) -> None:
+    """Test that entries are keyed by both the prompt and the model configuration."""
+    cache = LLMResponseCache(db_path=str(tmp_path / "llm_cache.db"))
+    cache.update("prompt", "model-a", _response("[]"))
+
+    assert cache.lookup("other prompt", "model-a") is None
+    assert cache.lookup("prompt", "model-b") is None
+
+
+def test_expired_entries_are_not_returned(tmp_path: Path) -> None:
+    """Test that entries older than the TTL are ignored."""
+    cache = LLMResponseCache(db_path=str(tmp_path / "llm_cache.db"), ttl_seconds=-1)
+    cache.update("prompt", "model-a", _response("[]"))
+
+    assert cache.lookup("prompt", "model-a") is None
+
+
+def test_non_chat_generations_are_not_cached(tmp_path: Path) -> None:
+    """Test that completion-style generations are skipped."""
+    cache = LLMResponseCache(db_path=str(tmp_path / "llm_cache.db"))
+    cache.update("prompt", "model-a", [Generation(text="[]")])
+
+    assert cache.lookup("prompt", "model-a") is None
+
+
+def test_cache_persists_across_instances(tmp_path: Path) -> None:
+    """Test that a new cache instance on the same file sees earlier entries, e.g. in a later CLI run."""
+    db_path = str(tmp_path / "llm_cache.db")
+    LLMResponseCache(db_path=db_path).update("prompt", "model-a", _response("[]"))
+
+    assert LLMResponseCache(db_path=db_path).lookup("prompt", "model-a") is not None
+
+
+def test_trailing_whitespace_and_line_endings_share_an_entry(tmp_path: Path) -> None:
+    """Test that prompts differing only in trailing whitespace or CRLF line endings hit the same entry."""
+    cache = LLMResponseCache(db_path=str(tmp_path / "llm_cache.db"))
+    cache.update('[{"content": "x = 1  \\r\\n\\ty\\t\\n"}]', "model-a", _response("[]"))
+
+    assert cache.lookup('[{"content": "x = 1\\n\\ty\\n"}]', "model-a") is not None
+    # Indentation is significant and must not be normalized away
+    assert cache.lookup('[{"content": "x = 1\\ny\\n"}]', "model-a") is None
+
+
+def test_trailing_whitespace_at_the_end_of_a_message_is_ignored(tmp_path: Path) -> None:
+    """Test that whitespace before the closing quote of a message, i.e. on its last line, is ignored."""
+    cache = LLMResponseCache(db_path=str(tmp_path / "llm_cache.db"))
+    cache.update('[{"content": "x = 1  \\t"}]', "model-a", _response("[]"))
+
+    assert cache.lookup('[{"content": "x = 1"}]', "model-a") is not None
+
+
+def test_escaped_backslashes_are_not_normalized(tmp_path: Path) -> None:
+    """Test that a literal backslash followed by t or r is kept, rather than read as a tab or line ending."""
+    cache = LLMResponseCache(db_path=str(tmp_path / "llm_cache.db"))
+    cache.update('[{"content": "a\\\\t\\n"}]', "model-a", _response("[]"))
+    cache.update('[{"content": "b\\\\r\\n"}]', "model-a", _response("[]"))
+
+    assert cache.lookup('[{"content": "a\\\\\\n"}]', "model-a") is None
+    assert cache.lookup('[{"content": "b\\\\n"}]', "model-a") is None
+    assert cache.lookup('[{"content": "a\\\\t\\n"}]', "model-a") is not None
+
+
+def test_connections_are_closed_after_each_operation(tmp_path: Path) -> None:
+    """Test that no operation leaves its SQLite connection open."""
+    opened: list[sqlite3.Connection] = []
+    connect = sqlite3.connect
+
+    def tracking_connect(*args: object, **kwargs: object) -> sqlite3.Connection:
+        opened.append(connect(*args, **kwargs))  # pyright: ignore[reportArgumentType]
+        return opened[-1]
+
+    with patch("sqlite3.connect", tracking_connect):
+        cache = LLMResponseCache(db_path=str(tmp_path / "llm_cache.db"))
+        cache.update("prompt", "model-a", _response("[]"))
+        _ = cache.lookup("prompt", "model-a")
+        cache.clear()
+
+    assert len(opened) == 4
+    for connection in opened:
+        with pytest.raises(sqlite3.ProgrammingError, match="closed"):
+            _ = connection.execute("SELECT 1")
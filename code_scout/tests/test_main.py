@@ -0,0 +1,42 @@
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from cli.main import app
+
+
+@pytest.fixture
+def validate_cli_context() -> Generator[MagicMock, Any, None]:
+    with patch(
+        "core.llm_providers.langchain_provider.LangChainProvider.validate_cli_context",
+        side_effect=ValueError("missing API key"),
+    ) as validate:
+        yield validate
+
+
+def test_subcommand_help_skips_llm_validation(validate_cli_context: MagicMock) -> None:
+    """Test that help of a subcommand is shown without validating the LLM configuration."""
+    result = CliRunner().invoke(app, ["git", "review", "--help"])
+
+    assert result.exit_code == 0, result.stdout
+    assert "--source" in result.stdout
+    validate_cli_context.assert_not_called()
+
+
+def test_subcommand_group_without_command_skips_llm_validation(validate_cli_context: MagicMock) -> None:
+    """Test that a group invoked without a command shows its help without validating the LLM configuration."""
+    result = CliRunner().invoke(app, ["github"])
+
+    assert "review-pr" in result.stdout
+    validate_cli_context.assert_not_called()
+
+
+def test_help_flag_as_option_value_still_validates(validate_cli_context: MagicMock) -> None:
+    """Test that a help flag consumed as the value of another option doesn't skip the LLM validation."""
+    result = CliRunner().invoke(app, ["git", "review", "--source", "--help"])
+
+    assert result.exit_code == 1
+    validate_cli_context.assert_called_once()
@@ -1,12 +1,17 @@
+import json
+from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage
 
 from core.models.code_diff import CodeDiff
 from core.models.review_config import ReviewConfig
 from core.models.review_result import ReviewResult
 from core.review_chains.basic_review_chain import BasicReviewChain
+from core.review_chains.hunk_findings_cache import HunkFindingsCache
 from core.tools.file_content_tool import FileContentTool
 from core.utils.diff_parser import parse_diff_string
 
@@ -161,3 +166,120 @@ def test_basic_review_chain_without_tools(mock_llm_no_tools: CustomFakeChatModel
     # Verify LLM was invoked - the test passing means it was called successfully
     # The FakeListChatModel counter behavior may vary with agent framework
     assert len(findings) > 0  # This confirms the LLM was called and processed
+
+
+def test_basic_review_chain_batches_are_stable_per_file(sample_code_diff: CodeDiff) -> None:
+    """Test that with concurrency > 1 a file always lands in the same batch, whatever else is reviewed."""
+    diffs = [sample_code_diff.model_copy(update={"file_path": f"src/module_{i}.py"}) for i in range(6)]
+    chain = BasicReviewChain(ReviewConfig(langchain_tools=[], concurrency=3))
+    batches: list[list[str]] = []
+
+    def record_batch(batch: list[CodeDiff], _llm: Any) -> None:
+        batches.append([diff.file_path for diff in batch])
+
+    chain._invoke_llm = record_batch  # pyright: ignore[reportAttributeAccessIssue]
+    _ = chain.review(diffs, CustomFakeChatModel(responses=[]))
+    batches_before = sorted(batches)
+
+    batches.clear()
+    _ = chain.review(
+        [*diffs, sample_code_diff.model_copy(update={"file_path": "src/new.py"})], CustomFakeChatModel(responses=[])
+    )
+
+    # Adding a file only changes the batch it was assigned to; every other batch is sent exactly as before
+    assert all(batch in batches_before for batch in batches if "src/new.py" not in batch)
+    assert sum(len(batch) for batch in batches) == len(diffs) + 1
+
+
+def test_basic_review_chain_bounds_parallel_tool_calls(sample_code_diff: CodeDiff) -> None:
+    """Test that the configured tool concurrency is passed to the agent as its max_concurrency."""
+    chain = BasicReviewChain(ReviewConfig(langchain_tools=[FileContentTool()], tool_concurrency=1))
+
+    with patch("core.review_chains.basic_review_chain.create_react_agent") as create_agent:
+        create_agent.return_value.invoke.return_value = {"messages": []}
+        _ = chain.review([sample_code_diff], CustomFakeChatModel(responses=[]))
+
+    assert create_agent.return_value.invoke.call_args.kwargs["config"] == {"max_concurrency": 1}
+
+
+def _two_hunk_diff(first_hunk_value: str, second_hunk_start: int) -> CodeDiff:
+    diff_content = f"""diff --git a/src/app.py b/src/app.py
+--- a/src/app.py
++++ b/src/app.py
+@@ -1,3 +1,3 @@
+ import os
+-x = 1
++x = {first_hunk_value}
+ y = 3
+@@ -{second_hunk_start},3 +{second_hunk_start},4 @@ def main():
+ a = 1
++b = eval(input())
+ c = 3
+ d = 4
+"""
+    parsed_diff = parse_diff_string(diff_string=diff_content, filename="src/app.py")
+    assert parsed_diff
+    return CodeDiff(
+        diff=diff_content,
+        hunks=parsed_diff.hunks,
+        parsed_diff=parsed_diff,
+        file_path="src/app.py",
+        change_type="modified",
+    )
+
+
+def test_basic_review_chain_replays_findings_of_unchanged_hunks(tmp_path: Path) -> None:
+    """Test that a re-review only sends changed hunks to the LLM and replays the findings of the others."""
+    chain = BasicReviewChain(
+        ReviewConfig(langchain_tools=[], findings_cache=HunkFindingsCache(db_path=str(tmp_path / "hunks.db")))
+    )
+    batches: list[list[tuple[int, ...]]] = []
+
+    def review_batch(batch: list[CodeDiff], _llm: Any) -> AIMessage:
+        batches.append([tuple(hunk.target_start for hunk in diff.hunks) for diff in batch])
+        # Flags the eval() call whenever the second hunk is part of the request
+        findings = [
+            {
+                "severity": "critical",
+                "category": "security",
+                "file_path": diff.file_path,
+                "line_number": hunk.target_start + 1,
+                "message": "eval of user input",
+            }
+            for diff in batch
+            for hunk in diff.hunks
+            if hunk.heading == "def main():"
+        ]
+        return AIMessage(content=json.dumps(findings))
+
+    chain._invoke_llm = review_batch  # pyright: ignore[reportAttributeAccessIssue]
+    llm = CustomFakeChatModel(responses=[])
+    first = chain.review([_two_hunk_diff("2", second_hunk_start=20)], llm)
+    # The first hunk changes, and the unchanged second hunk moves down by ten lines
+    second = chain.review([_two_hunk_diff("42", second_hunk_start=30)], llm)
+    third = chain.review([_two_hunk_diff("42", second_hunk_start=30)], llm)
+
+    assert batches == [[(1, 20)], [(1,)]]
+    assert [(f.message, f.line_number) for f in first.findings] == [("eval of user input", 21)]
+    assert [(f.message, f.line_number) for f in second.findings] == [("eval of user input", 31)]
+    assert [(f.message, f.line_number) for f in third.findings] == [("eval of user input", 31)]
+
+
+def test_basic_review_chain_does_not_cache_unattributable_findings(tmp_path: Path) -> None:
+    """Test that a batch with a finding outside of its hunks is not cached, so that finding isn't lost."""
+    chain = BasicReviewChain(
+        ReviewConfig(langchain_tools=[], findings_cache=HunkFindingsCache(db_path=str(tmp_path / "hunks.db")))
+    )
+    calls: list[int] = []
+
+    def review_batch(batch: list[CodeDiff], _llm: Any) -> AIMessage:
+        calls.append(len(batch))
+        return AIMessage(content=json.dumps([{"file_path": "src/app.py", "message": "File is getting long"}]))
+
+    chain._invoke_llm = review_batch  # pyright: ignore[reportAttributeAccessIssue]
+    llm = CustomFakeChatModel(responses=[])
+    _ = chain.review([_two_hunk_diff("2", second_hunk_start=20)], llm)
+    result = chain.review([_two_hunk_diff("2", second_hunk_start=20)], llm)
+
+    assert calls == [1, 1]
+    assert [f.message for f in result.findings] == ["File is getting long"]